@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+"""Batched enemy steering.
+
+Enemies are grouped by ``behavior`` and each group is advanced with one set
+of vectorized operations over position and speed arrays. Slow and stun
+effects arrive as a per-enemy speed multiplier array, so the stepper never
+mutates ``Enemy.speed``.
+
+Enemies keep a float ``exact_center`` alongside their integer rect so slow
+movement accumulates instead of being truncated every frame. Anything that
+moves an enemy's rect directly (knockback, gravity rounds, clamping) is
+picked up on the next step because the rect no longer matches the rounded
+exact center.
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .entities import Enemy
+
+Steering = Callable[[np.ndarray], np.ndarray]
+
+
+def _steer_orbit(unit: np.ndarray) -> np.ndarray:
+    # Rotate the heading to the player by a quarter turn to circle it.
+    return np.stack((-unit[:, 1], unit[:, 0]), axis=1)
+
+
+def _steer_direct(unit: np.ndarray) -> np.ndarray:
+    return unit
+
+
+STEERING: Dict[str, Steering] = {
+    "orbit": _steer_orbit,
+    "strafer": _steer_direct,
+    "charger": _steer_direct,
+}
+
+
+class EnemyAIStepper:
+    def __init__(self, steering: Optional[Dict[str, Steering]] = None) -> None:
+        self.steering = dict(STEERING if steering is None else steering)
+
+    def step(
+        self,
+        enemies: Sequence[Enemy],
+        target: Tuple[float, float],
+        dt: float,
+        speed_scale: Optional[np.ndarray] = None,
+    ) -> None:
+        """Move every enemy toward ``target`` according to its behavior."""
+
+        count = len(enemies)
+        if count == 0:
+            return
+        rect_centers = np.array([enemy.rect.center for enemy in enemies], dtype=np.float64)
+        exact = np.array([enemy.exact_center for enemy in enemies], dtype=np.float64)
+        moved = np.any(np.round(exact) != rect_centers, axis=1)
+        position = np.where(moved[:, None], rect_centers, exact)
+
+        speed = np.array([enemy.speed for enemy in enemies], dtype=np.float64)
+        if speed_scale is not None:
+            speed *= speed_scale
+
+        delta = np.asarray(target, dtype=np.float64) - position
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        unit = np.zeros_like(delta)
+        nonzero = distance > 0
+        unit[nonzero] = delta[nonzero] / distance[nonzero, None]
+
+        heading = np.zeros_like(delta)
+        groups: Dict[str, list] = {}
+        for index, enemy in enumerate(enemies):
+            groups.setdefault(enemy.behavior, []).append(index)
+        for behavior, indices in groups.items():
+            steer = self.steering.get(behavior)
+            if steer is None:
+                continue
+            members = np.asarray(indices, dtype=np.intp)
+            heading[members] = steer(unit[members])
+
+        position += heading * (speed * dt)[:, None]
+        rounded = np.round(position).astype(np.int64)
+        for enemy, exact_center, center in zip(enemies, position.tolist(), rounded.tolist()):
+            enemy.exact_center = (exact_center[0], exact_center[1])
+            enemy.rect.center = (center[0], center[1])
+            enemy.cooldown = max(0.0, enemy.cooldown - dt)
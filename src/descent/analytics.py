@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+"""Closed-form DPS and time-to-kill tables for the weapon catalog.
+
+:func:`compute_tables` mirrors :class:`~descent.weapon.WeaponInstance` and
+the damage path in :meth:`~descent.simulation.Simulation.step` with NumPy
+broadcasting, evaluating every weapon x diver x meta level x stage x
+difficulty x enemy cell in one pass instead of looping over profiles.
+Meta level ``n`` means every Dive Lab track bought to ``n`` (capped per
+track), matching :func:`descent.balance.meta_progress`. Times ignore the
+fixed tick's rounding to whole frames and projectile travel unless a
+``distance`` is given.
+
+Run with ``python -m descent.analytics`` for a per-weapon CSV.
+"""
+
+import argparse
+import csv
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .character_data import CHARACTERS, CharacterProfile
+from .constants import COMBO_DAMAGE_STEP, DIFFICULTY_PRESETS
+from .enemy_data import ENEMIES, STAGE_MODIFIERS, EnemyProfile
+from .meta import UPGRADE_DEFINITIONS
+from .weapon_data import WEAPON_CATALOG, WeaponProfile
+
+# Minimum gap WeaponInstance.trigger_reload enforces after emptying a magazine.
+RELOAD_LOCKOUT = 0.2
+MIN_FOCUS = 0.1
+DIFFICULTY_ORDER = ("story", "normal", "veteran", "apocalypse")
+
+
+@dataclass(frozen=True)
+class CatalogTables:
+    """Broadcast result arrays plus the labels of each axis.
+
+    ``burst_dps``, ``sustained_dps`` and ``shot_damage`` are shaped
+    ``(weapon, diver, meta level)``; ``enemy_hp`` is
+    ``(stage, difficulty, enemy)``; ``shots_to_kill`` and ``ttk`` combine both
+    as ``(weapon, diver, meta level, stage, difficulty, enemy)``.
+    """
+
+    weapons: Tuple[str, ...]
+    characters: Tuple[str, ...]
+    meta_levels: Tuple[int, ...]
+    stages: Tuple[int, ...]
+    difficulties: Tuple[str, ...]
+    enemies: Tuple[str, ...]
+    shot_damage: np.ndarray
+    burst_dps: np.ndarray
+    sustained_dps: np.ndarray
+    enemy_hp: np.ndarray
+    shots_to_kill: np.ndarray
+    ttk: np.ndarray
+
+    def index(self, character: str, meta_level: int = 0) -> Tuple[int, int]:
+        return self.characters.index(character), self.meta_levels.index(meta_level)
+
+    def mean_ttk(self, stage: int = 1, difficulty: str = "normal") -> np.ndarray:
+        """Roster-averaged TTK as ``(weapon, diver, meta level)``."""
+
+        stage_index = self.stages.index(stage)
+        difficulty_index = self.difficulties.index(difficulty)
+        return self.ttk[:, :, :, stage_index, difficulty_index, :].mean(axis=-1)
+
+
+def _upgrade_bonus(stat: str, levels: np.ndarray) -> np.ndarray:
+    """Summed per-level bonus to ``stat`` when every track sits at ``levels``."""
+
+    bonus = np.zeros(levels.shape, dtype=np.float64)
+    for definition in UPGRADE_DEFINITIONS.values():
+        if definition.stat == stat:
+            bonus += definition.per_level * np.minimum(levels, definition.max_level)
+    return bonus
+
+
+def compute_tables(
+    weapons: Sequence[WeaponProfile] = WEAPON_CATALOG,
+    characters: Sequence[CharacterProfile] = CHARACTERS,
+    meta_levels: Optional[Sequence[int]] = None,
+    stages: Optional[Sequence[int]] = None,
+    difficulties: Sequence[str] = DIFFICULTY_ORDER,
+    enemies: Sequence[EnemyProfile] = ENEMIES,
+    combo_level: int = 0,
+    distance: float = 0.0,
+) -> CatalogTables:
+    if meta_levels is None:
+        meta_levels = range(max(definition.max_level for definition in UPGRADE_DEFINITIONS.values()) + 1)
+    if stages is None:
+        stages = sorted(STAGE_MODIFIERS)
+    meta_levels = tuple(int(level) for level in meta_levels)
+    stages = tuple(int(stage) for stage in stages)
+    difficulties = tuple(difficulties)
+
+    # Weapon axis (W, 1, 1).
+    base_damage = np.array([weapon.base_damage for weapon in weapons], dtype=np.float64)[:, None, None]
+    fire_rate = np.array([weapon.fire_rate for weapon in weapons], dtype=np.float64)[:, None, None]
+    magazine = np.array([weapon.magazine for weapon in weapons], dtype=np.float64)[:, None, None]
+    reload_time = np.array([weapon.reload_time for weapon in weapons], dtype=np.float64)[:, None, None]
+    speed = np.array([weapon.projectile_speed for weapon in weapons], dtype=np.float64)[:, None, None]
+
+    # Diver x meta level axes (1, C, M).
+    levels = np.array(meta_levels, dtype=np.float64)
+    damage_mult = (
+        np.array([character.stats["damage"] for character in characters], dtype=np.float64)[:, None]
+        + _upgrade_bonus("damage", levels)[None, :]
+    )[None]
+    focus = (
+        np.array([character.stats["focus"] for character in characters], dtype=np.float64)[:, None]
+        + _upgrade_bonus("focus", levels)[None, :]
+    )[None]
+    focus = np.maximum(focus, MIN_FOCUS)
+
+    shot_damage = base_damage * damage_mult * (1.0 + combo_level * COMBO_DAMAGE_STEP)
+    interval = 1.0 / (fire_rate * focus)
+    # The shot after the last round waits for the reload (and its lockout).
+    reload_gap = np.maximum(np.maximum(interval, RELOAD_LOCKOUT), reload_time / focus)
+    cycle = (magazine - 1.0) * interval + reload_gap
+    burst_dps = shot_damage / interval
+    sustained_dps = magazine * shot_damage / cycle
+
+    # Stage x difficulty x enemy axes (S, D, E); Enemy truncates max_hp to int.
+    fallback = STAGE_MODIFIERS[max(STAGE_MODIFIERS)]
+    stage_hp = np.array([STAGE_MODIFIERS.get(stage, fallback)["hp"] for stage in stages], dtype=np.float64)
+    difficulty_hp = np.array([DIFFICULTY_PRESETS[name].get("enemy_hp", 1.0) for name in difficulties])
+    base_hp = np.array([enemy.max_hp for enemy in enemies], dtype=np.float64)
+    enemy_hp = np.floor(base_hp[None, None, :] * (stage_hp[:, None, None] * difficulty_hp[None, :, None]))
+
+    # Shots are fired from a full magazine; shot i lands after i intervals plus
+    # one reload gap per magazine already emptied.
+    shots = np.ceil(enemy_hp[None, None, None] / shot_damage[..., None, None, None])
+    last = shots - 1.0
+    mag = magazine[..., None, None, None]
+    reloads = np.floor(last / mag)
+    ttk = (
+        reloads * cycle[..., None, None, None]
+        + (last - reloads * mag) * interval[..., None, None, None]
+        + distance / speed[..., None, None, None]
+    )
+
+    return CatalogTables(
+        weapons=tuple(weapon.name for weapon in weapons),
+        characters=tuple(character.name for character in characters),
+        meta_levels=meta_levels,
+        stages=stages,
+        difficulties=difficulties,
+        enemies=tuple(enemy.key for enemy in enemies),
+        shot_damage=shot_damage,
+        burst_dps=burst_dps,
+        sustained_dps=sustained_dps,
+        enemy_hp=enemy_hp,
+        shots_to_kill=shots.astype(np.int64),
+        ttk=ttk,
+    )
+
+
+@lru_cache(maxsize=1)
+def catalog_tables() -> CatalogTables:
+    """Tables for the shipped catalog, roster and presets (computed once)."""
+
+    return compute_tables()
+
+
+def drop_weights(character: str, meta_level: int = 0, strength: float = 1.0) -> List[float]:
+    """Per-catalog weights for :func:`~descent.weapon_data.random_weapon`.
+
+    Weights scale with ``(median DPS / weapon DPS) ** strength`` for the diver
+    at ``meta_level``: ``0`` is a uniform roll, positive values favour weaker
+    guns to flatten power spikes, negative values favour stronger ones.
+    """
+
+    tables = catalog_tables()
+    character_index, level_index = tables.index(character, min(meta_level, tables.meta_levels[-1]))
+    dps = tables.sustained_dps[:, character_index, level_index]
+    weights = (np.median(dps) / dps) ** strength
+    return (weights / weights.sum()).tolist()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m descent.analytics", description="Print analytic DPS and time-to-kill per weapon."
+    )
+    parser.add_argument("--character", default=CHARACTERS[0].name)
+    parser.add_argument("--meta-level", type=int, default=0)
+    parser.add_argument("--stage", type=int, default=1)
+    parser.add_argument("--difficulty", choices=DIFFICULTY_ORDER, default="normal")
+    parser.add_argument("--combo", type=int, default=0, help="combo tier applied to every hit")
+    parser.add_argument("--distance", type=float, default=0.0, help="add projectile travel over this range")
+    args = parser.parse_args(argv)
+
+    selected = [character for character in CHARACTERS if character.name.lower() == args.character.lower()]
+    if not selected:
+        raise SystemExit(f"Unknown diver: {args.character}")
+    tables = compute_tables(
+        characters=selected,
+        meta_levels=(args.meta_level,),
+        stages=(args.stage,),
+        difficulties=(args.difficulty,),
+        combo_level=args.combo,
+        distance=args.distance,
+    )
+    ttk = tables.ttk[:, 0, 0, 0, 0, :]
+    order = np.argsort(-tables.sustained_dps[:, 0, 0])
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["weapon", "shot_damage", "burst_dps", "sustained_dps", *(f"ttk_{key}" for key in tables.enemies)])
+    for index in order.tolist():
+        writer.writerow(
+            [
+                tables.weapons[index],
+                round(float(tables.shot_damage[index, 0, 0]), 2),
+                round(float(tables.burst_dps[index, 0, 0]), 2),
+                round(float(tables.sustained_dps[index, 0, 0]), 2),
+                *(round(float(value), 3) for value in ttk[index]),
+            ]
+        )
+
+
+if __name__ == "__main__":
+    main()
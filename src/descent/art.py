@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict, Sequence, Tuple
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Mapping, Optional, Sequence, Tuple
 
 import pygame
 
 Color = Tuple[int, int, int]
 
+SPRITE_CACHE_LIMIT = 512
+
 # Each sprite is defined by rows of characters. Palette maps characters to RGBA colors.
 # "_" denotes transparency.
 
@@ -126,13 +129,13 @@ PALETTES: Dict[str, Dict[str, Color]] = {
 }
 
 
-def make_surface_from_map(
+def build_surface_from_map(
     pixel_map: Sequence[str],
-    palette: Dict[str, Color],
+    palette: Mapping[str, Color],
     scale: int = 4,
     tint: Color | None = None,
 ) -> pygame.Surface:
-    """Convert a pixel map to a pygame Surface."""
+    """Convert a pixel map to a pygame Surface without consulting the cache."""
 
     width = len(pixel_map[0])
     height = len(pixel_map)
@@ -158,7 +161,97 @@ def make_surface_from_map(
             surface.set_at((x, y), color)
 
     surface = pygame.transform.scale(surface, (width * scale, height * scale))
-    return surface.convert_alpha()
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+class SpriteCache:
+    """Process-wide LRU cache of surfaces built from pixel maps.
+
+    Surfaces handed out by :meth:`get` are shared between every caller, so
+    entities that draw onto their image must take a ``copy()`` first.
+    """
+
+    def __init__(self, max_entries: int = SPRITE_CACHE_LIMIT) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        pixel_map: Sequence[str],
+        palette: Mapping[str, Color],
+        scale: int,
+        tint: Color | None,
+    ) -> Hashable:
+        return (
+            tuple(pixel_map),
+            tuple(sorted((key, tuple(color)) for key, color in palette.items())),
+            int(scale),
+            tuple(tint) if tint is not None else None,
+        )
+
+    def get(
+        self,
+        pixel_map: Sequence[str],
+        palette: Mapping[str, Color],
+        scale: int = 4,
+        tint: Color | None = None,
+    ) -> pygame.Surface:
+        key = self.make_key(pixel_map, palette, scale, tint)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = build_surface_from_map(pixel_map, palette, scale, tint)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def resize(self, max_entries: int) -> None:
+        self.max_entries = max(1, int(max_entries))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "capacity": self.max_entries,
+        }
+
+
+SPRITE_CACHE = SpriteCache()
+
+
+def make_surface_from_map(
+    pixel_map: Sequence[str],
+    palette: Mapping[str, Color],
+    scale: int = 4,
+    tint: Color | None = None,
+) -> pygame.Surface:
+    """Return the shared cached Surface for a pixel map.
+
+    The result is shared; call ``copy()`` before drawing onto it.
+    """
+
+    return SPRITE_CACHE.get(pixel_map, palette, scale, tint)
 
 
 def player_sprite(primary: Color, secondary: Color) -> pygame.Surface:
@@ -177,6 +270,68 @@ def enemy_sprite(enemy_key: str) -> pygame.Surface:
     return make_surface_from_map(pixel_map, palette)
 
 
+ENEMY_TINT_ALPHA = 80
+
+# Additive RGB washes layered over an enemy variant while a status is active.
+ENEMY_STATUS_OVERLAYS: Dict[str, Color] = {
+    "ignite": (90, 36, 0),
+    "slow": (0, 48, 96),
+    "stun": (80, 80, 40),
+}
+
+
+class EnemyVariantTable:
+    """Prebaked enemy surfaces keyed by (enemy key, tint, status overlay).
+
+    Variants are shared between every enemy that uses them; spawning is a
+    dictionary lookup instead of a fresh tint surface and blend per enemy.
+    """
+
+    def __init__(self) -> None:
+        self._variants: Dict[Tuple[str, Color, Optional[str]], pygame.Surface] = {}
+
+    def build(self, profiles: Iterable[Tuple[str, Color]]) -> None:
+        """Bake every status overlay for each ``(key, tint)`` pair."""
+
+        for key, tint in profiles:
+            for status in (None, *ENEMY_STATUS_OVERLAYS):
+                self.get(key, tint, status)
+
+    def get(self, enemy_key: str, tint: Color, status: Optional[str] = None) -> pygame.Surface:
+        lookup = (enemy_key, tuple(tint), status)
+        surface = self._variants.get(lookup)
+        if surface is None:
+            surface = self._bake(enemy_key, tint, status)
+            self._variants[lookup] = surface
+        return surface
+
+    def clear(self) -> None:
+        self._variants.clear()
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def _bake(self, enemy_key: str, tint: Color, status: Optional[str]) -> pygame.Surface:
+        if status is not None:
+            surface = self.get(enemy_key, tint).copy()
+            surface.fill(ENEMY_STATUS_OVERLAYS[status], special_flags=pygame.BLEND_RGB_ADD)
+            return surface
+        surface = enemy_sprite(enemy_key).copy()
+        surface.fill((*tint, ENEMY_TINT_ALPHA), special_flags=pygame.BLEND_RGBA_ADD)
+        return surface
+
+
+ENEMY_VARIANTS = EnemyVariantTable()
+
+
+def prebake_enemy_variants(profiles: Iterable[Tuple[str, Color]]) -> None:
+    ENEMY_VARIANTS.build(profiles)
+
+
+def enemy_variant(enemy_key: str, tint: Color, status: Optional[str] = None) -> pygame.Surface:
+    return ENEMY_VARIANTS.get(enemy_key, tint, status)
+
+
 def projectile_sprite(color: Color) -> pygame.Surface:
     palette = {
         "G": (max(0, color[0] - 40), max(0, color[1] - 40), max(0, color[2] - 40), 120),
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+"""Monte Carlo balance sweeps over the weapon x diver matrix.
+
+Run with ``python -m descent balance``. Every (diver, weapon, trial) cell is
+one headless :class:`~descent.simulation.Simulation` run flown by an
+:class:`~descent.simulation.Autopilot` with its own seed. The autopilot kites,
+fires its signature ability and binds relics. Runs are independent, so they
+are farmed out to a process pool with ``imap_unordered`` and scale with
+cores. Each finished run is streamed to the optional runs CSV as it arrives,
+and the aggregated table (mean stage, kills, damage dealt/taken, Aether
+payout and survival rate per diver/weapon pair, next to the analytic DPS
+and TTK from :mod:`descent.analytics`) is written at the end.
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from multiprocessing import get_context
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from .analytics import catalog_tables, drop_weights
+from .character_data import CHARACTERS
+from .constants import DIFFICULTY_PRESETS
+from .meta import UPGRADE_DEFINITIONS, ProgressState
+from .relic_data import random_relic
+from .simulation import FIXED_DT, Autopilot, Simulation
+from .weapon_data import WEAPON_CATALOG
+
+BALANCE_SEED = 7
+MAX_RUN_SECONDS = 240.0
+KITE_RADIUS = 180.0
+PROGRESS_EVERY = 50
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    character_index: int
+    weapon_index: int
+    trial: int
+    seed: int
+    difficulty: str = "normal"
+    meta_level: int = 0
+    relics: int = 0
+    max_seconds: float = MAX_RUN_SECONDS
+    drop_strength: float = 0.0
+
+
+@dataclass
+class RunResult:
+    character: str
+    weapon: str
+    trial: int
+    seed: int
+    stage: int
+    wave: int
+    kills: int
+    damage_dealt: float
+    damage_taken: float
+    reward: int
+    duration: float
+    survived: bool
+
+
+def run_seed(base_seed: int, character_index: int, weapon_index: int, trial: int) -> int:
+    """Derive a stable per-run seed that does not depend on scheduling order."""
+
+    return random.Random(f"{base_seed}:{character_index}:{weapon_index}:{trial}").getrandbits(32)
+
+
+def meta_progress(character_name: str, level: int) -> ProgressState:
+    """A save with every upgrade track bought to ``level`` for one diver."""
+
+    progress = ProgressState()
+    if level > 0:
+        progress.purchased[character_name] = {
+            key: min(level, definition.max_level) for key, definition in UPGRADE_DEFINITIONS.items()
+        }
+    return progress
+
+
+def simulate_run(spec: RunSpec) -> RunResult:
+    random.seed(spec.seed)
+    character = CHARACTERS[spec.character_index]
+    weapon = WEAPON_CATALOG[spec.weapon_index]
+    sim = Simulation(DIFFICULTY_PRESETS[spec.difficulty])
+    if spec.drop_strength:
+        sim.drop_weights = drop_weights(character.name, spec.meta_level, spec.drop_strength)
+    sim.start(character, meta_progress(character.name, spec.meta_level), weapon)
+    for _ in range(spec.relics):
+        sim.attune_relic(random_relic(exclude={relic.key for relic in sim.relics}))
+    pilot = Autopilot(kite_radius=KITE_RADIUS, use_ability=True, collect_relics=True)
+    for _ in range(int(spec.max_seconds / FIXED_DT)):
+        sim.step(pilot.command(sim))
+        if sim.defeated:
+            break
+    return RunResult(
+        character=character.name,
+        weapon=weapon.name,
+        trial=spec.trial,
+        seed=spec.seed,
+        stage=sim.wave_state.stage if sim.wave_state else 0,
+        wave=sim.wave_state.wave if sim.wave_state else 0,
+        kills=sim.kills,
+        damage_dealt=round(sim.total_damage_dealt, 2),
+        damage_taken=round(sim.total_damage_taken, 2),
+        reward=sim.reward(),
+        duration=round(sim.elapsed_time, 2),
+        survived=not sim.defeated,
+    )
+
+
+def build_specs(
+    character_indices: Sequence[int],
+    weapon_indices: Sequence[int],
+    trials: int,
+    base_seed: int = BALANCE_SEED,
+    **options,
+) -> List[RunSpec]:
+    return [
+        RunSpec(ci, wi, trial, run_seed(base_seed, ci, wi, trial), **options)
+        for ci in character_indices
+        for wi in weapon_indices
+        for trial in range(trials)
+    ]
+
+
+def run_sweep(specs: Sequence[RunSpec], workers: Optional[int] = None) -> Iterator[RunResult]:
+    """Yield results in completion order from a pool of ``workers`` processes."""
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        yield from map(simulate_run, specs)
+        return
+    # Small chunks keep every core busy even when run lengths vary widely.
+    chunksize = max(1, min(8, len(specs) // (workers * 8)))
+    # Spawned workers inherit the environment; keep their import banners quiet.
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    with get_context("spawn").Pool(workers) as pool:
+        yield from pool.imap_unordered(simulate_run, specs, chunksize)
+
+
+SUMMARY_FIELDS = (
+    "character",
+    "weapon",
+    "runs",
+    "stage",
+    "kills",
+    "damage_dealt",
+    "damage_taken",
+    "reward",
+    "duration",
+    "survival_rate",
+    "dps",
+    "ttk",
+)
+
+
+def aggregate(results: Iterable[RunResult]) -> List[Dict[str, object]]:
+    """Average every metric per (diver, weapon) pair, best mean stage first."""
+
+    groups: Dict[tuple, List[RunResult]] = {}
+    for result in results:
+        groups.setdefault((result.character, result.weapon), []).append(result)
+    table = []
+    for (character, weapon), runs in groups.items():
+        count = len(runs)
+        row: Dict[str, object] = {"character": character, "weapon": weapon, "runs": count}
+        for name in ("stage", "kills", "damage_dealt", "damage_taken", "reward", "duration"):
+            row[name] = round(sum(getattr(run, name) for run in runs) / count, 2)
+        row["survival_rate"] = round(sum(run.survived for run in runs) / count, 3)
+        table.append(row)
+    table.sort(key=lambda row: (row["stage"], row["kills"]), reverse=True)
+    return table
+
+
+def annotate_analytics(table: List[Dict[str, object]], meta_level: int = 0, difficulty: str = "normal") -> None:
+    """Add the closed-form sustained DPS and stage-1 roster TTK to each row."""
+
+    tables = catalog_tables()
+    level = min(meta_level, tables.meta_levels[-1])
+    weapon_indices = {name: index for index, name in enumerate(tables.weapons)}
+    mean_ttk = tables.mean_ttk(1, difficulty)
+    for row in table:
+        character_index, level_index = tables.index(str(row["character"]), level)
+        weapon_index = weapon_indices[str(row["weapon"])]
+        row["dps"] = round(float(tables.sustained_dps[weapon_index, character_index, level_index]), 2)
+        row["ttk"] = round(float(mean_ttk[weapon_index, character_index, level_index]), 3)
+
+
+def _parse_characters(values: Optional[Sequence[str]]) -> List[int]:
+    if not values:
+        return list(range(len(CHARACTERS)))
+    names = {character.name.lower(): index for index, character in enumerate(CHARACTERS)}
+    indices = []
+    for value in values:
+        if value.isdigit() and int(value) < len(CHARACTERS):
+            indices.append(int(value))
+        elif value.lower() in names:
+            indices.append(names[value.lower()])
+        else:
+            raise SystemExit(f"Unknown diver: {value}")
+    return indices
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--trials", type=int, default=1, help="runs per diver/weapon pair")
+    parser.add_argument("--character", action="append", help="diver name or index (repeatable; default all)")
+    parser.add_argument("--weapons", type=int, help="sample this many weapons instead of the full catalog")
+    parser.add_argument("--workers", type=int, help="worker processes (default: every core)")
+    parser.add_argument("--seed", type=int, default=BALANCE_SEED)
+    parser.add_argument("--max-seconds", type=float, default=MAX_RUN_SECONDS, help="simulated time cap per run")
+    parser.add_argument("--difficulty", choices=sorted(DIFFICULTY_PRESETS), default="normal")
+    parser.add_argument("--meta-level", type=int, default=0, help="level of every Dive Lab upgrade")
+    parser.add_argument("--relics", type=int, default=0, help="random relics bound at the start of each run")
+    parser.add_argument(
+        "--drop-strength",
+        type=float,
+        default=0.0,
+        help="weight weapon drops by analytic DPS (positive favours weaker guns)",
+    )
+    parser.add_argument("--runs-csv", metavar="PATH", help="stream every finished run to PATH")
+    parser.add_argument("--output", metavar="PATH", help="write the aggregated table to PATH as CSV")
+
+
+def run_cli(args: argparse.Namespace) -> int:
+    weapon_indices = list(range(len(WEAPON_CATALOG)))
+    if args.weapons:
+        weapon_indices = sorted(random.Random(args.seed).sample(weapon_indices, min(args.weapons, len(weapon_indices))))
+    specs = build_specs(
+        _parse_characters(args.character),
+        weapon_indices,
+        args.trials,
+        args.seed,
+        difficulty=args.difficulty,
+        meta_level=args.meta_level,
+        relics=args.relics,
+        max_seconds=args.max_seconds,
+        drop_strength=args.drop_strength,
+    )
+    runs_file: Optional[TextIO] = open(args.runs_csv, "w", newline="") if args.runs_csv else None
+    writer = csv.DictWriter(runs_file, [field.name for field in fields(RunResult)]) if runs_file else None
+    if writer:
+        writer.writeheader()
+    results: List[RunResult] = []
+    started = time.perf_counter()
+    try:
+        for result in run_sweep(specs, args.workers):
+            results.append(result)
+            if writer:
+                writer.writerow(asdict(result))
+                runs_file.flush()
+            if len(results) % PROGRESS_EVERY == 0 or len(results) == len(specs):
+                elapsed = time.perf_counter() - started
+                print(f"{len(results)}/{len(specs)} runs in {elapsed:.1f}s", file=sys.stderr)
+    finally:
+        if runs_file:
+            runs_file.close()
+
+    table = aggregate(results)
+    annotate_analytics(table, args.meta_level, args.difficulty)
+    if args.output:
+        with open(args.output, "w", newline="") as handle:
+            summary = csv.DictWriter(handle, SUMMARY_FIELDS)
+            summary.writeheader()
+            summary.writerows(table)
+    out = csv.DictWriter(sys.stdout, SUMMARY_FIELDS)
+    out.writeheader()
+    out.writerows(table)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="descent balance", description="Run Monte Carlo balance sweeps.")
+    add_arguments(parser)
+    sys.exit(run_cli(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+"""Reproducible stress scenarios for the full game loop.
+
+Run with ``python -m descent bench``. Each scenario drives a real
+:class:`~descent.game.Game` under the SDL dummy video driver with a seeded
+RNG and the fixed simulation tick, calling ``Game.update`` and
+``Game.draw`` once per frame with the frame profiler enabled. Scenarios run
+in a fresh worker process so sprite caches start cold and peak memory is
+per scenario. Results are printed (or written) as JSON and can be compared
+against a saved baseline, exiting non-zero on regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pygame
+
+from .abilities import ABILITIES
+from .constants import DIFFICULTY_PRESETS
+from .game import Game
+from .ledger import RunLedger
+from .meta import ProgressState
+from .profiler import FrameProfiler
+from .simulation import FIXED_DT, Autopilot, InputCommand
+from .weapon_data import WEAPON_CATALOG
+
+BENCH_SEED = 20240601
+DEFAULT_TOLERANCE = 0.15
+LONG_RUN_STAGE = 20
+
+
+class BenchGame(Game):
+    """A Game whose input comes from a stationary :class:`Autopilot`.
+
+    It plays on a fresh in-memory profile (no Dive Lab upgrades, default
+    settings) and a throwaway run ledger, so results do not depend on, and
+    never touch, the player's save or run history.
+    """
+
+    def __init__(self, frames: int) -> None:
+        self.scratch = tempfile.TemporaryDirectory(prefix="descent-bench-")
+        super().__init__(
+            idle_wait=False,
+            profiler=FrameProfiler(enabled=True, window=frames),
+            persist_progress=False,
+            progress=ProgressState(),
+            ledger=RunLedger(Path(self.scratch.name) / "runs.sqlite3"),
+        )
+        self.autofire = False
+        self.autopilot = Autopilot()
+        self.difficulty_profile = DIFFICULTY_PRESETS["normal"]
+        self.sim.difficulty_profile = self.difficulty_profile
+
+    def read_input(self) -> InputCommand:
+        command = self.autopilot.command(self.sim)
+        command.fire = self.autofire and command.aim is not None
+        return command
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    frames: int
+    setup: Callable[[BenchGame], None]
+    # Called after every frame; returning True ends the scenario early.
+    per_frame: Optional[Callable[[BenchGame], bool]] = None
+
+
+def _start_invulnerable(game: BenchGame, character_index: int = 0, damage: float = 0.0, focus: float = 0.0) -> None:
+    game.start_run(game.characters[character_index])
+    player = game.sim.player
+    # Keep the run alive for the whole scenario.
+    player.apply_permanent_bonus("max_hp", 1e9)
+    if damage:
+        player.apply_permanent_bonus("damage", damage)
+    if focus:
+        player.apply_permanent_bonus("focus", focus)
+
+
+def _spawn_enemies(game: BenchGame, count: int) -> None:
+    sim = game.sim
+    sim.wave_state.remaining_to_spawn += count
+    for _ in range(count):
+        sim.spawn_enemy_wave()
+
+
+def _setup_mixed_horde(game: BenchGame) -> None:
+    _start_invulnerable(game)
+    _spawn_enemies(game, 1000)
+
+
+def _setup_firehose(game: BenchGame) -> None:
+    drone_diver = next(
+        index for index, character in enumerate(game.characters) if character.ability_key == "drone_command"
+    )
+    _start_invulnerable(game, drone_diver, focus=2.0)
+    burst = max((profile for profile in WEAPON_CATALOG if "Burst" in profile.name), key=lambda p: p.fire_rate)
+    game.sim.equip_weapon(burst)
+    for _ in range(4):
+        game.sim.execute_ability(ABILITIES["drone_command"])
+    _spawn_enemies(game, 200)
+    game.autofire = True
+
+
+def _setup_stasis(game: BenchGame) -> None:
+    _start_invulnerable(game)
+    center = pygame.Vector2(game.sim.player.rect.center)
+    for index in range(10):
+        offset = pygame.Vector2(60, 0).rotate(index * 36)
+        game.sim.fields.add(center + offset, 260.0, 0.45, 600.0, source="stasis")
+    _spawn_enemies(game, 300)
+
+
+def _setup_menu(game: BenchGame) -> None:
+    game.state = "main_menu"
+
+
+def _setup_long_run(game: BenchGame) -> None:
+    _start_invulnerable(game, damage=200.0, focus=4.0)
+    game.autofire = True
+
+
+def _long_run_frame(game: BenchGame) -> bool:
+    sim = game.sim
+    # Release the next enemy every tick so each stage takes seconds, not minutes.
+    sim.stage_timer = 1.0
+    return bool(sim.wave_state and sim.wave_state.stage >= LONG_RUN_STAGE)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("mixed_horde", "1000 enemies with mixed behaviors", 300, _setup_mixed_horde),
+        Scenario("firehose", "Burst weapon plus drone squads firing into 200 enemies", 600, _setup_firehose),
+        Scenario("stasis_stack", "10 stacked stasis fields over 300 enemies", 600, _setup_stasis),
+        Scenario("menu_idle", "Main menu redrawn every frame", 600, _setup_menu),
+        Scenario(
+            "long_run",
+            f"Autopiloted run until stage {LONG_RUN_STAGE}",
+            60 * 60 * 10,
+            _setup_long_run,
+            _long_run_frame,
+        ),
+    )
+}
+
+
+def run_scenario(name: str, frames: Optional[int] = None, seed: int = BENCH_SEED, trace_memory: bool = False) -> Dict:
+    """Run one scenario in this process and return its measurements."""
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    scenario = SCENARIOS[name]
+    frames = frames or scenario.frames
+    random.seed(seed)
+    game = BenchGame(frames)
+    scenario.setup(game)
+    profiler = game.profiler
+
+    if trace_memory:
+        tracemalloc.start()
+    played = 0
+    started = time.perf_counter()
+    for _ in range(frames):
+        profiler.begin_frame()
+        game.update(FIXED_DT)
+        game.draw()
+        profiler.end_frame()
+        played += 1
+        if scenario.per_frame and scenario.per_frame(game):
+            break
+    elapsed = time.perf_counter() - started
+    traced_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    if trace_memory:
+        tracemalloc.stop()
+
+    summary = profiler.summary()
+    frame_p50, frame_p95, frame_p99 = summary.pop("frame", (0.0, 0.0, 0.0))
+    result = {
+        "description": scenario.description,
+        "frames": played,
+        "seconds": round(elapsed, 4),
+        "fps": round(played / elapsed, 2) if elapsed > 0 else 0.0,
+        "frame_ms": {"p50": round(frame_p50, 3), "p95": round(frame_p95, 3), "p99": round(frame_p99, 3)},
+        "phases_ms": {
+            phase: {"p50": round(p50, 3), "p95": round(p95, 3), "p99": round(p99, 3)}
+            for phase, (p50, p95, p99) in sorted(summary.items())
+        },
+        "entities": game.profiler_counts(),
+        "stage": game.sim.wave_state.stage if game.sim.wave_state else 0,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+    if traced_peak is not None:
+        result["traced_peak_kb"] = traced_peak // 1024
+    pygame.quit()
+    return result
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_suite(
+    names: Sequence[str],
+    frames: Optional[int] = None,
+    seed: int = BENCH_SEED,
+    trace_memory: bool = False,
+    isolate: bool = True,
+) -> Dict:
+    results: Dict[str, Dict] = {}
+    for name in names:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                results[name] = pool.submit(run_scenario, name, frames, seed, trace_memory).result()
+        else:
+            results[name] = run_scenario(name, frames, seed, trace_memory)
+    return {
+        "meta": {
+            "seed": seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "scenarios": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Return a description of every scenario that regressed past ``tolerance``."""
+
+    regressions: List[str] = []
+    for name, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["fps"] < previous["fps"] * (1.0 - tolerance):
+            regressions.append(f"{name}: fps {current['fps']} < baseline {previous['fps']}")
+        now_p95 = current["frame_ms"]["p95"]
+        was_p95 = previous["frame_ms"]["p95"]
+        if was_p95 and now_p95 > was_p95 * (1.0 + tolerance):
+            regressions.append(f"{name}: frame p95 {now_p95}ms > baseline {was_p95}ms")
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="scenario to run (repeatable; defaults to all)",
+    )
+    parser.add_argument("--frames", type=int, help="override the frame budget of every scenario")
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--output", metavar="PATH", help="write the JSON report to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a previous JSON report")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--trace-memory", action="store_true", help="also report tracemalloc peaks (slower)")
+    parser.add_argument("--in-process", action="store_true", help="run every scenario in this process")
+
+
+def run_cli(args: argparse.Namespace) -> int:
+    names = args.scenario or list(SCENARIOS)
+    report = run_suite(names, args.frames, args.seed, args.trace_memory, isolate=not args.in_process)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+    print(payload)
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="descent bench", description="Run Descent's stress scenarios.")
+    add_arguments(parser)
+    sys.exit(run_cli(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,15 @@ from __future__ import annotations
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 TARGET_FPS = 60
+# Event-driven presentation: static screens block on input for up to
+# IDLE_WAIT_MS, animate toasts at TOAST_FPS, and an unfocused window
+# drops to UNFOCUSED_FPS.
+IDLE_WAIT_MS = 500
+TOAST_FPS = 30
+UNFOCUSED_FPS = 4
 
 TILE_SIZE = 48
+SPATIAL_CELL_SIZE = TILE_SIZE
 PLAYER_LAYER = 5
 ENEMY_LAYER = 4
 PROJECTILE_LAYER = 6
@@ -86,6 +93,9 @@ DIFFICULTY_PRESETS = {
     "apocalypse": {"enemy_hp": 1.4, "enemy_damage": 1.32, "enemy_speed": 1.12, "spawn_rate": 1.22, "reward": 1.25},
 }
 
+# Bonus damage per combo tier applied to every projectile hit.
+COMBO_DAMAGE_STEP = 0.05
+
 
 FONT_PATH = None  # Use pygame default
 
@@ -0,0 +1,491 @@
+from __future__ import annotations
+
+"""Data-driven content: JSON sources compiled into a memory-mapped cache.
+
+Weapons parts, relics, abilities, divers, enemies and achievements are
+authored as JSON under ``descent/data``. :func:`compile_sources` validates
+them against :data:`SCHEMAS` (types, unknown fields, duplicate keys and
+cross references), expands the weapon parts into the full catalog, and
+prebuilds lookup indexes by key, relic tag, keyword and weapon element.
+
+The compiled sections are written as a :mod:`descent.savefile` container to
+``~/.descent_content.bin``, keyed by a SHA-256 of the source files, the
+content schema and the container format. :class:`ContentBundle` hashes the
+sources at startup and memory-maps the cache when the hash matches; otherwise
+it recompiles and rewrites it. Sections are decoded straight out of the map
+on first use, so nothing is validated or expanded again until a source file
+changes.
+
+Run ``python -m descent.content`` to validate the sources and report on the
+cache.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import mmap
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .savefile import FORMAT_VERSION, RawSection, SaveFormatError, pack, unpack, write_atomic
+
+SOURCE_DIR = Path(__file__).resolve().parent / "data"
+CACHE_PATH = Path.home() / ".descent_content.bin"
+# Bump whenever compile_sources changes what it emits for the same sources.
+CONTENT_VERSION = 1
+
+SOURCES = {
+    "weapons": "weapons.json",
+    "relics": "relics.json",
+    "abilities": "abilities.json",
+    "characters": "characters.json",
+    "enemies": "enemies.json",
+    "achievements": "achievements.json",
+}
+
+REQUIRED = object()
+# Field name, value type and default (REQUIRED when the field must be given).
+# Types: text, integer, number, texts (list of text), color (RGB triple) and
+# numbers (text -> number mapping).
+SCHEMAS: Dict[str, Tuple[Tuple[str, str, object], ...]] = {
+    "relics": (
+        ("key", "text", REQUIRED),
+        ("name", "text", REQUIRED),
+        ("description", "text", REQUIRED),
+        ("effect", "text", REQUIRED),
+        ("value", "number", REQUIRED),
+        ("tags", "texts", []),
+    ),
+    "abilities": (
+        ("key", "text", REQUIRED),
+        ("name", "text", REQUIRED),
+        ("description", "text", REQUIRED),
+        ("cooldown", "number", REQUIRED),
+        ("effect", "text", REQUIRED),
+        ("magnitude", "number", REQUIRED),
+        ("payload", "numbers", {}),
+    ),
+    "characters": (
+        ("name", "text", REQUIRED),
+        ("title", "text", REQUIRED),
+        ("description", "text", REQUIRED),
+        ("stats", "numbers", REQUIRED),
+        ("primary_color", "color", REQUIRED),
+        ("secondary_color", "color", REQUIRED),
+        ("starting_keywords", "texts", REQUIRED),
+        ("ability_key", "text", REQUIRED),
+        ("ability_summary", "text", REQUIRED),
+    ),
+    "enemies": (
+        ("key", "text", REQUIRED),
+        ("name", "text", REQUIRED),
+        ("description", "text", REQUIRED),
+        ("max_hp", "integer", REQUIRED),
+        ("speed", "number", REQUIRED),
+        ("damage", "number", REQUIRED),
+        ("behavior", "text", REQUIRED),
+        ("tint", "color", REQUIRED),
+    ),
+    "achievements": (
+        ("key", "text", REQUIRED),
+        ("name", "text", REQUIRED),
+        ("description", "text", REQUIRED),
+        ("metric", "text", REQUIRED),
+        ("threshold", "number", REQUIRED),
+        ("scope", "text", "run"),
+        ("reward_credits", "integer", 0),
+        ("hint", "text", ""),
+    ),
+}
+# Field that identifies a record in the key index (``key`` when not listed).
+KEY_FIELDS = {"weapons": "name", "characters": "name"}
+# Fields stored as JSON lists that the profiles expect as tuples.
+TUPLE_FIELDS = {
+    "weapons": ("color", "keywords"),
+    "relics": ("tags",),
+    "characters": ("primary_color", "secondary_color", "starting_keywords"),
+    "enemies": ("tint",),
+}
+RECORD_SECTIONS = ("weapons", "relics", "abilities", "characters", "enemies", "achievements")
+CACHE_SECTIONS = ("index", "weapon_parts", "stage_modifiers", *RECORD_SECTIONS)
+ACHIEVEMENT_SCOPES = ("run", "total", "meta")
+BASE_TYPE_STATS = ("damage", "fire_rate", "speed", "spread", "magazine", "reload")
+STAGE_STATS = ("hp", "damage", "speed")
+
+
+class ContentError(ValueError):
+    """Raised when a content source file is missing, malformed or inconsistent."""
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_value(kind: str, value: object) -> bool:
+    if kind == "text":
+        return isinstance(value, str)
+    if kind == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind == "number":
+        return _is_number(value)
+    if kind == "texts":
+        return isinstance(value, list) and all(isinstance(item, str) for item in value)
+    if kind == "color":
+        return (
+            isinstance(value, list)
+            and len(value) == 3
+            and all(isinstance(item, int) and 0 <= item <= 255 for item in value)
+        )
+    if kind == "numbers":
+        return isinstance(value, dict) and all(_is_number(item) for item in value.values())
+    raise ValueError(f"unknown field type: {kind}")
+
+
+def validate_records(section: str, records: object) -> List[Dict[str, object]]:
+    """Check ``records`` against ``SCHEMAS[section]`` and fill in defaults."""
+
+    if not isinstance(records, list):
+        raise ContentError(f"{section}: expected a list of records")
+    schema = SCHEMAS[section]
+    names = {name for name, _, _ in schema}
+    key_field = KEY_FIELDS.get(section, "key")
+    seen = set()
+    validated = []
+    for position, record in enumerate(records):
+        where = f"{section}[{position}]"
+        if not isinstance(record, dict):
+            raise ContentError(f"{where}: expected an object")
+        unknown = sorted(set(record) - names)
+        if unknown:
+            raise ContentError(f"{where}: unknown field(s) {', '.join(unknown)}")
+        checked: Dict[str, object] = {}
+        for name, kind, default in schema:
+            if name not in record:
+                if default is REQUIRED:
+                    raise ContentError(f"{where}: missing field {name!r}")
+                checked[name] = copy.deepcopy(default)
+                continue
+            if not _check_value(kind, record[name]):
+                raise ContentError(f"{where}.{name}: expected {kind}, got {record[name]!r}")
+            checked[name] = record[name]
+        key = checked[key_field]
+        if key in seen:
+            raise ContentError(f"{where}: duplicate {key_field} {key!r}")
+        seen.add(key)
+        validated.append(checked)
+    return validated
+
+
+def _validate_parts(parts: object) -> Dict[str, Dict[str, Dict[str, object]]]:
+    if not isinstance(parts, dict):
+        raise ContentError("weapons: expected an object of part groups")
+    groups = ("base_types", "manufacturers", "elements", "element_colors")
+    for group in groups:
+        if not isinstance(parts.get(group), dict) or not parts[group]:
+            raise ContentError(f"weapons.{group}: expected a non-empty object")
+    for group in ("base_types", "manufacturers", "elements"):
+        for name, part in parts[group].items():
+            where = f"weapons.{group}.{name}"
+            if not isinstance(part, dict):
+                raise ContentError(f"{where}: expected an object")
+            for stat, value in part.items():
+                kind = "texts" if stat == "keywords" else "number"
+                if not _check_value(kind, value):
+                    raise ContentError(f"{where}.{stat}: expected {kind}, got {value!r}")
+                if kind == "number" and value <= 0:
+                    raise ContentError(f"{where}.{stat}: must be positive")
+    for name, base in parts["base_types"].items():
+        missing = [stat for stat in BASE_TYPE_STATS if stat not in base]
+        if missing:
+            raise ContentError(f"weapons.base_types.{name}: missing {', '.join(missing)}")
+    for name, element in parts["elements"].items():
+        if "damage" not in element:
+            raise ContentError(f"weapons.elements.{name}: missing damage")
+        if not _check_value("color", parts["element_colors"].get(name)):
+            raise ContentError(f"weapons.element_colors: no RGB color for element {name!r}")
+    unknown = sorted(set(parts) - set(groups))
+    if unknown:
+        raise ContentError(f"weapons: unknown group(s) {', '.join(unknown)}")
+    return {group: parts[group] for group in groups}
+
+
+def expand_weapons(parts: Mapping[str, Mapping[str, Mapping[str, object]]]) -> Tuple[List[dict], Dict[str, List[int]]]:
+    """Every element x manufacturer x base type weapon, plus positions per element."""
+
+    weapons: List[dict] = []
+    by_element: Dict[str, List[int]] = {}
+    for base_name, base in parts["base_types"].items():
+        for maker_name, maker in parts["manufacturers"].items():
+            for element_name, element in parts["elements"].items():
+                damage = base["damage"] * maker.get("damage", 1.0) * element["damage"]
+                fire_rate = base["fire_rate"] * maker.get("fire_rate", 1.0)
+                projectile_speed = base["speed"] * maker.get("speed", 1.0)
+                spread = base["spread"] * maker.get("spread", 1.0)
+                magazine = max(4, int(base["magazine"] * maker.get("magazine", 1.0)))
+                reload_time = base["reload"] * maker.get("reload", 1.0)
+                keywords = [base_name.lower(), maker_name.lower(), element_name.lower()]
+                keywords += list(maker.get("keywords", ())) + list(element.get("keywords", ()))
+                by_element.setdefault(element_name, []).append(len(weapons))
+                weapons.append(
+                    {
+                        "name": f"{element_name} {maker_name} {base_name}",
+                        "base_damage": round(damage, 2),
+                        "fire_rate": round(fire_rate, 2),
+                        "projectile_speed": round(projectile_speed, 2),
+                        "spread": round(spread, 2),
+                        "magazine": magazine,
+                        "reload_time": round(reload_time, 2),
+                        "color": list(parts["element_colors"][element_name]),
+                        "keywords": keywords,
+                    }
+                )
+    return weapons, by_element
+
+
+def read_sources(source_dir: Path = SOURCE_DIR) -> Dict[str, bytes]:
+    sources = {}
+    for section, filename in SOURCES.items():
+        try:
+            sources[section] = (source_dir / filename).read_bytes()
+        except OSError as exc:
+            raise ContentError(f"cannot read content source {filename}: {exc}") from exc
+    return sources
+
+
+def source_hash(sources: Mapping[str, bytes]) -> str:
+    digest = hashlib.sha256(f"descent-content/{CONTENT_VERSION}/{FORMAT_VERSION}".encode("ascii"))
+    for section in sorted(sources):
+        body = sources[section]
+        digest.update(f"\0{section}\0{len(body)}\0".encode("ascii"))
+        digest.update(body)
+    return digest.hexdigest()
+
+
+def compile_sources(sources: Mapping[str, bytes]) -> Dict[str, object]:
+    """Validate the raw source files and build every cache section."""
+
+    parsed = {}
+    for section, body in sources.items():
+        try:
+            parsed[section] = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ContentError(f"{SOURCES[section]}: {exc}") from exc
+
+    parts = _validate_parts(parsed["weapons"])
+    weapons, by_element = expand_weapons(parts)
+    enemies_source = parsed["enemies"]
+    if not isinstance(enemies_source, dict) or set(enemies_source) != {"enemies", "stage_modifiers"}:
+        raise ContentError("enemies: expected an object with 'enemies' and 'stage_modifiers'")
+    records = {
+        "weapons": weapons,
+        "relics": validate_records("relics", parsed["relics"]),
+        "abilities": validate_records("abilities", parsed["abilities"]),
+        "characters": validate_records("characters", parsed["characters"]),
+        "enemies": validate_records("enemies", enemies_source["enemies"]),
+        "achievements": validate_records("achievements", parsed["achievements"]),
+    }
+
+    stage_modifiers = enemies_source["stage_modifiers"]
+    if not isinstance(stage_modifiers, dict) or not stage_modifiers:
+        raise ContentError("enemies.stage_modifiers: expected a non-empty object")
+    for stage, modifiers in stage_modifiers.items():
+        where = f"enemies.stage_modifiers.{stage}"
+        if not stage.isdigit():
+            raise ContentError(f"{where}: stage keys must be whole numbers")
+        if not _check_value("numbers", modifiers) or any(stat not in modifiers for stat in STAGE_STATS):
+            raise ContentError(f"{where}: expected numbers for {', '.join(STAGE_STATS)}")
+    abilities = {ability["key"] for ability in records["abilities"]}
+    for character in records["characters"]:
+        if character["ability_key"] not in abilities:
+            raise ContentError(f"characters.{character['name']}: unknown ability {character['ability_key']!r}")
+    for achievement in records["achievements"]:
+        if achievement["scope"] not in ACHIEVEMENT_SCOPES:
+            raise ContentError(f"achievements.{achievement['key']}: unknown scope {achievement['scope']!r}")
+
+    keys = {
+        section: {record[KEY_FIELDS.get(section, "key")]: position for position, record in enumerate(rows)}
+        for section, rows in records.items()
+    }
+    tags: Dict[str, Dict[str, List[int]]] = {}
+    for position, relic in enumerate(records["relics"]):
+        for tag in relic["tags"]:
+            tags.setdefault(tag, {}).setdefault("relics", []).append(position)
+    keywords: Dict[str, Dict[str, List[int]]] = {}
+    for section, field in (("weapons", "keywords"), ("characters", "starting_keywords")):
+        for position, record in enumerate(records[section]):
+            for keyword in dict.fromkeys(record[field]):
+                keywords.setdefault(keyword, {}).setdefault(section, []).append(position)
+    elements = {element: {"weapons": positions} for element, positions in by_element.items()}
+
+    return {
+        "index": {"key": keys, "tag": tags, "keyword": keywords, "element": elements},
+        "weapon_parts": parts,
+        "stage_modifiers": stage_modifiers,
+        **records,
+    }
+
+
+class ContentBundle:
+    """Compiled content, loaded from the cache (or rebuilt) on first use."""
+
+    def __init__(self, source_dir: Optional[Path] = None, cache_path: Optional[Path] = None) -> None:
+        self.source_dir = source_dir or SOURCE_DIR
+        self.cache_path = cache_path or CACHE_PATH
+        self.source_hash = ""
+        self.rebuilt = False
+        self.cache_written = False
+        self.load_ms = 0.0
+        self._sections: Optional[Dict[str, object]] = None
+        self._decoded: Dict[str, object] = {}
+        self._map: Optional[mmap.mmap] = None
+
+    def _load(self) -> Dict[str, object]:
+        if self._sections is not None:
+            return self._sections
+        started = time.perf_counter()
+        sources = read_sources(self.source_dir)
+        self.source_hash = source_hash(sources)
+        sections = self._map_cache()
+        if sections is None:
+            sections = self._compile(sources)
+        self._sections = sections
+        self.load_ms = (time.perf_counter() - started) * 1000.0
+        return sections
+
+    def _compile(self, sources: Mapping[str, bytes]) -> Dict[str, object]:
+        compiled = compile_sources(sources)
+        self._decoded = dict(compiled)
+        self.rebuilt = True
+        try:
+            write_atomic(self.cache_path, pack({"manifest": self._manifest(compiled), **compiled}))
+            self.cache_written = True
+        except OSError:
+            # A read-only home only costs the next launch a recompile.
+            pass
+        return dict(compiled)
+
+    def _manifest(self, compiled: Mapping[str, object]) -> Dict[str, object]:
+        return {
+            "hash": self.source_hash,
+            "version": CONTENT_VERSION,
+            "counts": {section: len(compiled[section]) for section in RECORD_SECTIONS},
+        }
+
+    def _map_cache(self) -> Optional[Dict[str, object]]:
+        try:
+            with open(self.cache_path, "rb") as stream:
+                mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            sections = unpack(mapping, copy=False)
+            manifest = sections["manifest"].decode()
+            if (
+                isinstance(manifest, dict)
+                and manifest.get("hash") == self.source_hash
+                and all(name in sections for name in CACHE_SECTIONS)
+            ):
+                self._map = mapping
+                return dict(sections)
+        except (SaveFormatError, KeyError, ValueError):
+            # Any damage to the table or manifest is a miss; the cache is rebuilt.
+            pass
+        # Release every view into the map before closing it.
+        sections = None
+        mapping.close()
+        return None
+
+    def _recompile(self) -> None:
+        """Replace a mapped cache whose body turned out to be damaged."""
+
+        self._sections = None
+        mapping, self._map = self._map, None
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                # A caller still holds a view; the map closes once it is dropped.
+                pass
+        self._sections = self._compile(read_sources(self.source_dir))
+
+    def section(self, name: str) -> object:
+        """Decoded section ``name`` (decoded once, then shared)."""
+
+        decoded = self._decoded.get(name)
+        if decoded is None:
+            raw = self._load()[name]
+            try:
+                decoded = raw.decode() if isinstance(raw, RawSection) else raw
+            except SaveFormatError:
+                # The manifest matched but a body is corrupt: rebuild from the sources.
+                raw = None
+                self._recompile()
+                decoded = self._decoded[name]
+            self._decoded[name] = decoded
+        return decoded
+
+    def records(self, section: str) -> List[Dict[str, object]]:
+        """Fresh record dicts for ``section``, with list fields restored to tuples."""
+
+        tuple_fields = TUPLE_FIELDS.get(section, ())
+        rows = []
+        for record in self.section(section):
+            row = dict(record)
+            for name in tuple_fields:
+                row[name] = tuple(row[name])
+            rows.append(row)
+        return rows
+
+    def position(self, section: str, key: str) -> int:
+        """Index of ``key`` in :meth:`records` for ``section``; ``KeyError`` if absent."""
+
+        return self.section("index")["key"][section][key]
+
+    def find(self, index: str, value: str, section: str) -> Tuple[int, ...]:
+        """Positions in ``section`` listed under ``value`` in ``index`` (tag, keyword or element)."""
+
+        return tuple(self.section("index")[index].get(value, {}).get(section, ()))
+
+    def stats(self) -> Dict[str, object]:
+        self._load()
+        return {
+            "hash": self.source_hash,
+            "cache": str(self.cache_path),
+            "mapped": self._map is not None,
+            "rebuilt": self.rebuilt,
+            "cache_written": self.cache_written,
+            "load_ms": round(self.load_ms, 3),
+            "counts": {section: len(self.section(section)) for section in RECORD_SECTIONS},
+        }
+
+
+CONTENT = ContentBundle()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m descent.content", description="Validate content sources and report on the compiled cache."
+    )
+    parser.add_argument("--rebuild", action="store_true", help="recompile and rewrite the cache even if it is current")
+    parser.add_argument("--check", action="store_true", help="only validate the sources; leave the cache alone")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        sources = read_sources()
+        try:
+            compiled = compile_sources(sources)
+        except ContentError as exc:
+            raise SystemExit(f"invalid content: {exc}")
+        counts = ", ".join(f"{section} {len(compiled[section])}" for section in RECORD_SECTIONS)
+        print(f"content ok ({source_hash(sources)[:16]}): {counts}")
+        return
+    if args.rebuild and CACHE_PATH.exists():
+        CACHE_PATH.unlink()
+    for name, value in CONTENT.stats().items():
+        print(f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
-from .art import enemy_sprite, pickup_sprite, player_sprite, projectile_sprite
+from .art import enemy_variant, pickup_sprite, player_sprite, projectile_sprite
 from .character_data import CharacterProfile
 from .constants import RUN_COLORS
 from .enemy_data import EnemyProfile
 from .weapon import WeaponInstance
 
+if TYPE_CHECKING:  # pragma: no cover - typing-only import
+    from .projectiles import ProjectileField
+    from .targeting import TargetIndex
+
 
 class Player(pygame.sprite.Sprite):
     def __init__(
@@ -150,21 +154,6 @@ class Player(pygame.sprite.Sprite):
         self.refresh_stats()
 
 
-class Projectile(pygame.sprite.Sprite):
-    def __init__(self, position: pygame.Vector2, direction: pygame.Vector2, speed: float, damage: float, color):
-        super().__init__()
-        self.direction = direction.normalize()
-        self.speed = speed
-        self.damage = damage
-        self.image = projectile_sprite(color)
-        self.rect = self.image.get_rect(center=position)
-
-    def update(self, dt: float) -> None:
-        movement = self.direction * self.speed * dt
-        self.rect.centerx += movement.x
-        self.rect.centery += movement.y
-
-
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, profile: EnemyProfile, stage_modifier: float, position: pygame.Vector2):
         super().__init__()
@@ -174,37 +163,21 @@ class Enemy(pygame.sprite.Sprite):
         self.speed = profile.speed * stage_modifier
         self.damage = profile.damage * stage_modifier
         self.behavior = profile.behavior
-        self.image = enemy_sprite(profile.key)
-        # Apply tint overlay
-        tint_surface = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-        tint_surface.fill((*profile.tint, 80))
-        self.image.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        self.status_overlay: Optional[str] = None
+        self.image = enemy_variant(profile.key, profile.tint)
         self.rect = self.image.get_rect(center=position)
+        self.exact_center = (float(self.rect.centerx), float(self.rect.centery))
         self.cooldown = random.uniform(0.4, 1.2)
 
-    def update(self, dt: float, player_position: pygame.Vector2) -> None:
-        self.cooldown = max(0.0, self.cooldown - dt)
-        direction = pygame.Vector2(player_position) - pygame.Vector2(self.rect.center)
-        if self.behavior == "orbit" and direction.length_squared() > 0:
-            angle = math.atan2(direction.y, direction.x) + math.pi / 2
-            direction = pygame.Vector2(math.cos(angle), math.sin(angle))
-        elif self.behavior == "strafer" and direction.length_squared() > 0:
-            angle = math.atan2(direction.y, direction.x)
-            direction = pygame.Vector2(math.cos(angle), math.sin(angle))
-        elif self.behavior == "charger" and direction.length_squared() > 0:
-            direction = direction.normalize()
-        else:
-            direction = pygame.Vector2(0, 0)
-
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
-        movement = direction * self.speed * dt
-        self.rect.centerx += movement.x
-        self.rect.centery += movement.y
-
     def take_damage(self, amount: float) -> None:
         self.hp = max(0.0, self.hp - amount)
 
+    def set_status_overlay(self, status: Optional[str]) -> None:
+        if status == self.status_overlay:
+            return
+        self.status_overlay = status
+        self.image = enemy_variant(self.profile.key, self.profile.tint, status)
+
 
 class Pickup(pygame.sprite.Sprite):
     def __init__(self, pickup_type: str, payload, position: pygame.Vector2, color):
@@ -248,8 +221,8 @@ class SupportDrone(pygame.sprite.Sprite):
     def update(
         self,
         dt: float,
-        enemies: Iterable[Enemy],
-        projectiles: pygame.sprite.Group,
+        targets: "TargetIndex",
+        projectiles: "ProjectileField",
         damage_bonus: float = 0.0,
     ) -> None:
         if not self.owner or self.owner.hp <= 0:
@@ -266,20 +239,19 @@ class SupportDrone(pygame.sprite.Sprite):
         self.cooldown = max(0.0, self.cooldown - dt)
         if self.cooldown > 0:
             return
-        enemy_list = [enemy for enemy in enemies if enemy.alive()]
-        if not enemy_list:
+        nearest = targets.nearest(self.rect.center)
+        if not nearest:
             return
-        target = min(enemy_list, key=lambda e: pygame.Vector2(e.rect.center).distance_to(self.rect.center))
+        target = nearest[0]
         direction = pygame.Vector2(target.rect.center) - pygame.Vector2(self.rect.center)
         if direction.length_squared() == 0:
             return
-        projectile = Projectile(
-            position=pygame.Vector2(self.rect.center),
-            direction=direction.normalize(),
+        projectiles.spawn(
+            self.rect.center,
+            direction,
             speed=420,
             damage=self.damage * (1.0 + damage_bonus),
             color=RUN_COLORS["loot"],
         )
-        projectiles.add(projectile)
         self.cooldown = self.fire_delay
 
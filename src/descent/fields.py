@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+"""Area slow fields from the "gravity" ability and "stasis" arena events.
+
+Each frame :meth:`FieldEffects.resolve` runs one radius query per field
+against the enemy spatial hash and caches the combined slow multiplier for
+every enemy inside a field. The AI step reads the cache instead of testing
+every enemy against every field.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterator, List, Sequence
+
+import numpy as np
+import pygame
+
+from .spatial import SpatialHash
+
+MIN_FIELD_MULTIPLIER = 0.25
+
+
+@dataclass
+class SlowField:
+    position: pygame.Vector2
+    radius: float
+    slow: float
+    duration: float
+    source: str = "gravity"
+
+    @property
+    def multiplier(self) -> float:
+        return max(MIN_FIELD_MULTIPLIER, 1.0 - self.slow)
+
+
+class FieldEffects:
+    def __init__(self) -> None:
+        self.fields: List[SlowField] = []
+        self._multipliers: Dict[Hashable, float] = {}
+
+    def __iter__(self) -> Iterator[SlowField]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def add(
+        self,
+        position: pygame.Vector2,
+        radius: float,
+        slow: float,
+        duration: float,
+        source: str = "gravity",
+    ) -> SlowField:
+        field = SlowField(pygame.Vector2(position), float(radius), float(slow), float(duration), source)
+        self.fields.append(field)
+        return field
+
+    def update(self, dt: float) -> None:
+        for field in self.fields:
+            field.duration -= dt
+        self.fields = [field for field in self.fields if field.duration > 0]
+
+    def resolve(self, index: SpatialHash) -> None:
+        """Recompute the cached multiplier for every enemy inside a field."""
+
+        multipliers: Dict[Hashable, float] = {}
+        for field in self.fields:
+            factor = field.multiplier
+            for enemy in index.query_radius((field.position.x, field.position.y), field.radius):
+                multipliers[enemy] = multipliers.get(enemy, 1.0) * factor
+        self._multipliers = multipliers
+
+    def multiplier(self, target: Hashable) -> float:
+        return self._multipliers.get(target, 1.0)
+
+    def multipliers(self, targets: Sequence[Hashable]) -> np.ndarray:
+        scale = np.ones(len(targets), dtype=np.float64)
+        if self._multipliers:
+            lookup = self._multipliers
+            for index, target in enumerate(targets):
+                factor = lookup.get(target)
+                if factor is not None:
+                    scale[index] = factor
+        return scale
+
+    def clear(self) -> None:
+        self.fields.clear()
+        self._multipliers.clear()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+"""Cached render layers for the arena.
+
+The arena floor and walls only change with the color profile, so
+:class:`ArenaLayer` renders them once per palette into an opaque surface and
+each frame costs a single blit. Dynamic overlays such as gravity-field rings
+are drawn separately on top by :func:`draw_field_overlay`.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pygame
+
+from .constants import SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
+
+Color = Tuple[int, int, int]
+
+FLOOR_RECT = pygame.Rect(80, 80, SCREEN_WIDTH - 160, SCREEN_HEIGHT - 160)
+WALL_RECT = pygame.Rect(60, 60, SCREEN_WIDTH - 120, SCREEN_HEIGHT - 120)
+WALL_THICKNESS = 8
+
+
+class ArenaLayer:
+    def __init__(
+        self,
+        size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        tile_floor: bool = False,
+    ) -> None:
+        self.size = size
+        self.tile_floor = tile_floor
+        self.builds = 0
+        self._surfaces: Dict[str, pygame.Surface] = {}
+
+    def surface(self, palette_name: str, colors: Mapping[str, Color]) -> pygame.Surface:
+        surface = self._surfaces.get(palette_name)
+        if surface is None:
+            surface = self._render(colors)
+            self._surfaces[palette_name] = surface
+        return surface
+
+    def draw(self, target: pygame.Surface, palette_name: str, colors: Mapping[str, Color]) -> None:
+        target.blit(self.surface(palette_name, colors), (0, 0))
+
+    def invalidate(self, palette_name: Optional[str] = None) -> None:
+        if palette_name is None:
+            self._surfaces.clear()
+        else:
+            self._surfaces.pop(palette_name, None)
+
+    def _render(self, colors: Mapping[str, Color]) -> pygame.Surface:
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(colors["void"])
+        pygame.draw.rect(surface, colors["floor"], FLOOR_RECT)
+        if self.tile_floor:
+            self._render_tiles(surface, colors["floor"])
+        pygame.draw.rect(surface, colors["wall"], WALL_RECT, WALL_THICKNESS)
+        self.builds += 1
+        return surface
+
+    def _render_tiles(self, surface: pygame.Surface, floor: Color) -> None:
+        seam = tuple(max(0, channel - 6) for channel in floor)
+        for x in range(FLOOR_RECT.left + TILE_SIZE, FLOOR_RECT.right, TILE_SIZE):
+            pygame.draw.line(surface, seam, (x, FLOOR_RECT.top), (x, FLOOR_RECT.bottom - 1))
+        for y in range(FLOOR_RECT.top + TILE_SIZE, FLOOR_RECT.bottom, TILE_SIZE):
+            pygame.draw.line(surface, seam, (FLOOR_RECT.left, y), (FLOOR_RECT.right - 1, y))
+
+
+def draw_field_overlay(target: pygame.Surface, fields: Iterable, color: Color) -> List[pygame.Rect]:
+    """Draw the outline ring of each active slow field and return their bounds."""
+
+    rects: List[pygame.Rect] = []
+    for field in fields:
+        position = (int(field.position.x), int(field.position.y))
+        rects.append(pygame.draw.circle(target, color, position, int(field.radius), 2))
+    return rects
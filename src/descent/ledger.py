@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+"""Per-run history stored in an embedded SQLite database.
+
+:func:`~descent.meta.record_run` folds every dive into lifetime totals; the
+ledger keeps each run as its own row (diver, starting and final weapon,
+relics, difficulty and the full ``run_stats``) in
+``~/.descent_runs.sqlite3`` so questions like "best stage per diver per
+weapon" are a single indexed query. The database runs in WAL mode. Inserts
+are queued to a writer thread that owns the only write connection and
+commits them in batches, so the game-over frame never waits on SQLite;
+queries open short-lived read connections, which WAL lets proceed alongside
+the writer. Nothing is created on disk until the first run is recorded.
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+from dataclasses import astuple, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+LEDGER_PATH = Path.home() / ".descent_runs.sqlite3"
+SCHEMA_VERSION = 1
+# The writer commits once this many runs are queued or the queue runs dry.
+BATCH_SIZE = 64
+RUN_METRICS = (
+    "kills",
+    "damage_dealt",
+    "damage_taken",
+    "relics_bound",
+    "weapons_synced",
+    "combo",
+    "duration",
+    "stage",
+    "credits",
+    "ability_uses",
+)
+# run_stats keys that are stored under a different column name.
+STAT_COLUMNS = {"relics": "relics_bound", "weapons": "weapons_synced"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ended_at TEXT NOT NULL,
+    character TEXT NOT NULL,
+    weapon_start TEXT NOT NULL,
+    weapon_end TEXT NOT NULL,
+    relics TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    kills INTEGER NOT NULL,
+    damage_dealt REAL NOT NULL,
+    damage_taken REAL NOT NULL,
+    relics_bound INTEGER NOT NULL,
+    weapons_synced INTEGER NOT NULL,
+    combo INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    stage INTEGER NOT NULL,
+    credits INTEGER NOT NULL,
+    ability_uses INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_character ON runs (character, stage);
+CREATE INDEX IF NOT EXISTS runs_weapon ON runs (weapon_start, stage);
+CREATE INDEX IF NOT EXISTS runs_difficulty ON runs (difficulty);
+CREATE INDEX IF NOT EXISTS runs_ended_at ON runs (ended_at);
+"""
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    ended_at: str
+    character: str
+    weapon_start: str
+    weapon_end: str
+    relics: str
+    difficulty: str
+    kills: int
+    damage_dealt: float
+    damage_taken: float
+    relics_bound: int
+    weapons_synced: int
+    combo: int
+    duration: float
+    stage: int
+    credits: int
+    ability_uses: int
+
+
+@dataclass(frozen=True)
+class LoadoutBest:
+    character: str
+    weapon: str
+    stage: int
+    runs: int
+
+
+COLUMNS = tuple(field.name for field in fields(RunRecord))
+INSERT = f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})"
+
+
+def run_record(
+    character: str,
+    weapon_start: str,
+    weapon_end: str,
+    relics: Sequence[str],
+    difficulty: str,
+    run_stats: Mapping[str, float],
+) -> RunRecord:
+    """Build a ledger row from a finished run's ``Simulation.run_stats``."""
+
+    metrics = {STAT_COLUMNS.get(key, key): value for key, value in run_stats.items()}
+    values = {name: metrics.get(name, 0) for name in RUN_METRICS}
+    for name in RUN_METRICS:
+        if name not in ("damage_dealt", "damage_taken", "duration"):
+            values[name] = int(values[name])
+    return RunRecord(
+        ended_at=datetime.utcnow().isoformat(timespec="seconds"),
+        character=character,
+        weapon_start=weapon_start,
+        weapon_end=weapon_end,
+        relics=",".join(relics),
+        difficulty=difficulty,
+        **values,
+    )
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=5.0)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        connection.executescript(SCHEMA)
+        connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        connection.commit()
+    return connection
+
+
+class RunLedger:
+    def __init__(self, path: Optional[Path] = None, batch_size: int = BATCH_SIZE) -> None:
+        self.path = path or LEDGER_PATH
+        self.batch_size = max(1, batch_size)
+        self.recorded = 0
+        self.batches = 0
+        self.failures = 0
+        self._queue: "queue.Queue[Optional[RunRecord]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def record(self, run: RunRecord) -> None:
+        """Queue ``run`` for the writer thread and return immediately."""
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="descent-ledger", daemon=True)
+                self._thread.start()
+            if not self._registered:
+                atexit.register(self.close)
+                self._registered = True
+        self._queue.put(run)
+
+    def _run(self) -> None:
+        connection: Optional[sqlite3.Connection] = None
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            runs = [run for run in batch if run is not None]
+            if runs:
+                try:
+                    if connection is None:
+                        connection = _connect(self.path)
+                    with connection:
+                        connection.executemany(INSERT, [astuple(run) for run in runs])
+                    self.recorded += len(runs)
+                    self.batches += 1
+                except sqlite3.Error:
+                    # Losing history must never take the game down with it.
+                    self.failures += len(runs)
+            for _ in batch:
+                self._queue.task_done()
+            if len(runs) < len(batch):
+                if connection is not None:
+                    connection.close()
+                return
+
+    def flush(self) -> None:
+        """Block until every queued run has been committed."""
+
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+
+    def _query(self, sql: str, parameters: Sequence[object] = ()) -> List[tuple]:
+        if not self.path.exists():
+            return []
+        try:
+            connection = _connect(self.path)
+            try:
+                return connection.execute(sql, parameters).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return []
+
+    def count(self, character: Optional[str] = None) -> int:
+        if character is None:
+            rows = self._query("SELECT COUNT(*) FROM runs")
+        else:
+            rows = self._query("SELECT COUNT(*) FROM runs WHERE character = ?", (character,))
+        return int(rows[0][0]) if rows else 0
+
+    def best_loadouts(
+        self,
+        limit: int = 10,
+        character: Optional[str] = None,
+        difficulty: Optional[str] = None,
+    ) -> List[LoadoutBest]:
+        """Deepest stage per (diver, starting weapon), best first."""
+
+        clauses, parameters = [], []
+        if character is not None:
+            clauses.append("character = ?")
+            parameters.append(character)
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            parameters.append(difficulty)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            f"SELECT character, weapon_start, MAX(stage), COUNT(*) FROM runs {where} "
+            "GROUP BY character, weapon_start ORDER BY MAX(stage) DESC, COUNT(*) DESC LIMIT ?",
+            (*parameters, limit),
+        )
+        return [LoadoutBest(*row) for row in rows]
+
+    def best_values(self, metrics: Sequence[str] = RUN_METRICS) -> Dict[str, float]:
+        """Single-run records per metric, keyed as requested (``run_stats`` names work)."""
+
+        columns = {name: STAT_COLUMNS.get(name, name) for name in metrics}
+        columns = {name: column for name, column in columns.items() if column in RUN_METRICS}
+        if not columns:
+            return {}
+        rows = self._query(f"SELECT {', '.join(f'MAX({column})' for column in columns.values())} FROM runs")
+        values = rows[0] if rows else (None,) * len(columns)
+        return {name: float(value or 0) for name, value in zip(columns, values)}
+
+    def progression(self, character: Optional[str] = None, limit: int = 200) -> List[Dict[str, object]]:
+        """The most recent ``limit`` runs, oldest first, for charting."""
+
+        where, parameters = ("WHERE character = ?", (character,)) if character else ("", ())
+        rows = self._query(
+            f"SELECT {', '.join(COLUMNS)} FROM runs {where} ORDER BY ended_at DESC, id DESC LIMIT ?",
+            (*parameters, limit),
+        )
+        return [dict(zip(COLUMNS, row)) for row in reversed(rows)]
+
+
+RUN_LEDGER = RunLedger()
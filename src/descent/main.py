@@ -1,13 +1,90 @@
 from __future__ import annotations
 
-from .game import Game
+import argparse
+import os
+import sys
+from importlib import import_module
+from typing import Optional, Sequence
 
+from .startup import STARTUP_TRACE
 
-def main() -> None:
-    game = Game()
+# Subcommands are imported only when selected so launching the game never
+# pays for the benchmark and balance tooling (and the analytics they pull in).
+SUBCOMMANDS = {
+    "bench": ("descent.bench", "run the reproducible stress-scenario benchmarks"),
+    "balance": ("descent.balance", "run Monte Carlo balance sweeps over divers and weapons"),
+}
+
+
+def build_parser(command: Optional[str] = None, probe: bool = False) -> argparse.ArgumentParser:
+    """The CLI parser, with only ``command``'s subcommand arguments registered.
+
+    A ``probe`` parser registers none and leaves ``-h`` after a subcommand to
+    the real parser; it is only used to find which subcommand was selected.
+    """
+
+    parser = argparse.ArgumentParser(prog="descent", description="Descent - Permutation Roguelite")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="redraw only changed screen regions during runs (for low-power machines)",
+    )
+    parser.add_argument(
+        "--no-idle-wait",
+        action="store_true",
+        help="keep redrawing menus and pause screens every frame instead of waiting for input",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="show the frame-phase profiler overlay at startup (toggle with F3)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="record frame phases and write Chrome trace-event JSON to PATH on exit",
+    )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="print an import/init/first-frame time breakdown to stderr",
+    )
+    commands = parser.add_subparsers(dest="command")
+    for name, (module, description) in SUBCOMMANDS.items():
+        subparser = commands.add_parser(name, help=description, add_help=not probe)
+        if name == command:
+            import_module(module).add_arguments(subparser)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = build_parser(probe=True).parse_known_args(argv)[0].command
+    if command:
+        # Subcommands print JSON reports on stdout; keep pygame's import banner
+        # (in this process and in their spawned workers) out of them.
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    args = build_parser(command).parse_args(argv)
+    if args.command:
+        sys.exit(import_module(SUBCOMMANDS[args.command][0]).run_cli(args))
+
+    trace = STARTUP_TRACE
+    trace.enabled = args.startup_trace
+    trace.mark("arguments parsed")
+    trace.watch_imports()
+    with trace.span("import game modules"):
+        from .game import Game
+        from .profiler import FrameProfiler
+
+    profiler = FrameProfiler(enabled=args.profile, tracing=bool(args.trace))
+    if args.profile:
+        profiler.toggle_overlay()
+    game = Game(dirty_rects=args.dirty_rects, idle_wait=not args.no_idle_wait, profiler=profiler, startup=trace)
     game.run()
+    if args.trace:
+        events = profiler.export_trace(args.trace)
+        print(f"Wrote {events} trace events to {args.trace}")
 
 
 if __name__ == "__main__":
     main()
-
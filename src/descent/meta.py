@@ -6,20 +6,41 @@ This module handles persistence of player currency, per-character upgrades,
 global settings, achievement tracking, and the stat adjustments that are
 applied when a run starts. It is intentionally lightweight so it functions on
 future Python versions without extra dependencies. Save data is stored in the
-user's home directory as a JSON file named ``.descent_progress.json``.
+user's home directory as ``.descent_progress.sav``, a sectioned container
+(see :mod:`descent.savefile`) whose settings section loads at startup while
+upgrades, achievements and statistics decode on first access. JSON saves from
+earlier builds are migrated once.
+
+:func:`save_progress` never touches the disk itself: it hands a detached
+snapshot to :data:`PROGRESS_WRITER`, which coalesces bursts of saves (slider
+drags, the credit award and run record at game over) and writes the newest
+snapshot from a background thread once the burst settles. Writes go through a
+temp file and an atomic rename, so a crash mid-write never truncates the save.
+Call :func:`flush_progress` before exiting; it is also registered with
+``atexit``.
 """
 
+import atexit
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, MutableMapping, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 from .character_data import CharacterProfile
 from .constants import COLOR_PALETTES, DIFFICULTY_PRESETS
+from .savefile import RawSection, SaveFormatError, encode_section, pack, unpack, write_atomic
 
 
-SAVE_PATH = Path.home() / ".descent_progress.json"
+SAVE_PATH = Path.home() / ".descent_progress.sav"
+# JSON save written by earlier builds; migrated into SAVE_PATH on first load.
+LEGACY_SAVE_PATH = Path.home() / ".descent_progress.json"
+# A save is written once no new save was requested for SAVE_DEBOUNCE seconds,
+# or SAVE_MAX_DELAY seconds after the first unsaved change, whichever is first.
+SAVE_DEBOUNCE = 0.75
+SAVE_MAX_DELAY = 5.0
 
 
 @dataclass
@@ -191,6 +212,58 @@ STAT_DEFAULTS: Dict[str, float] = {
 BEST_STATS = {"highest_combo", "longest_run", "deepest_stage"}
 
 
+# Sections of the save container decoded on first access rather than at load.
+LAZY_SECTIONS = ("purchased", "achievements", "statistics")
+
+
+def _parse_purchased(raw: object) -> Dict[str, Dict[str, int]]:
+    purchased: Dict[str, Dict[str, int]] = {}
+    if isinstance(raw, Mapping):
+        for char, upgrades in raw.items():
+            if isinstance(upgrades, Mapping):
+                purchased[char] = {k: int(v) for k, v in upgrades.items() if k in UPGRADE_DEFINITIONS}
+    return purchased
+
+
+def _parse_achievements(raw: object) -> Dict[str, AchievementRecord]:
+    achievements: Dict[str, AchievementRecord] = {}
+    if isinstance(raw, Mapping):
+        for key, record in raw.items():
+            if isinstance(record, Mapping):
+                achievements[key] = AchievementRecord.from_mapping(record)
+    return achievements
+
+
+def _parse_statistics(raw: object) -> Dict[str, float]:
+    statistics: Dict[str, float] = {}
+    if isinstance(raw, Mapping):
+        for key, value in raw.items():
+            try:
+                statistics[key] = float(value)
+            except (TypeError, ValueError):
+                continue
+    return statistics
+
+
+def _parse_unlocks(raw: object) -> Dict[str, bool]:
+    if not isinstance(raw, Mapping):
+        return {}
+    return {key: bool(value) for key, value in raw.items()}
+
+
+def _parse_settings(raw: object) -> SettingsState:
+    if isinstance(raw, Mapping):
+        return SettingsState.from_mapping(raw)
+    return SettingsState()
+
+
+SECTION_PARSERS = {
+    "purchased": _parse_purchased,
+    "achievements": _parse_achievements,
+    "statistics": _parse_statistics,
+}
+
+
 @dataclass
 class ProgressState:
     credits: int = 0
@@ -199,6 +272,30 @@ class ProgressState:
     statistics: Dict[str, float] = field(default_factory=dict)
     unlocks: Dict[str, bool] = field(default_factory=dict)
     settings: SettingsState = field(default_factory=SettingsState)
+    # Transient, never saved: meta-achievement counts kept up to date by
+    # purchase_upgrade, and a hook called whenever an achievement unlocks.
+    meta_counts: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+    on_unlock: Optional[Callable[["AchievementDefinition"], None]] = field(default=None, repr=False, compare=False)
+
+    def __getattr__(self, name: str) -> object:
+        # Only reached for attributes missing from the instance, i.e. the lazy
+        # sections of a state built by from_sections that nobody has read yet.
+        lazy = self.__dict__.get("_lazy")
+        if not lazy or name not in lazy:
+            raise AttributeError(name)
+        raw = lazy.pop(name)
+        try:
+            value = SECTION_PARSERS[name](raw.decode())
+        except SaveFormatError:
+            value = SECTION_PARSERS[name]({})
+        setattr(self, name, value)
+        if name == "purchased":
+            self.ensure_character(self.__dict__.get("_characters", ()))
+        elif name == "achievements":
+            self.ensure_achievements()
+        else:
+            self.ensure_statistics()
+        return value
 
     def ensure_character(self, characters: Iterable[CharacterProfile]) -> None:
         for character in characters:
@@ -217,88 +314,238 @@ class ProgressState:
     def to_dict(self) -> Dict[str, object]:
         return {
             "credits": self.credits,
-            "purchased": self.purchased,
+            "purchased": {name: dict(levels) for name, levels in self.purchased.items()},
             "achievements": {key: record.to_dict() for key, record in self.achievements.items()},
-            "statistics": self.statistics,
-            "unlocks": self.unlocks,
+            "statistics": dict(self.statistics),
+            "unlocks": dict(self.unlocks),
             "settings": self.settings.to_dict(),
         }
 
-    @classmethod
-    def from_mapping(cls, data: Mapping[str, object]) -> "ProgressState":
-        credits = int(data.get("credits", 0))
-        purchased: Dict[str, Dict[str, int]] = {}
-        raw_purchased = data.get("purchased", {})
-        if isinstance(raw_purchased, Mapping):
-            for char, upgrades in raw_purchased.items():
-                if isinstance(upgrades, Mapping):
-                    purchased[char] = {k: int(v) for k, v in upgrades.items() if k in UPGRADE_DEFINITIONS}
-
-        achievements: Dict[str, AchievementRecord] = {}
-        raw_achievements = data.get("achievements", {})
-        if isinstance(raw_achievements, Mapping):
-            for key, record in raw_achievements.items():
-                if isinstance(record, Mapping):
-                    achievements[key] = AchievementRecord.from_mapping(record)
-
-        statistics: Dict[str, float] = {}
-        raw_stats = data.get("statistics", {})
-        if isinstance(raw_stats, Mapping):
-            for key, value in raw_stats.items():
-                try:
-                    statistics[key] = float(value)
-                except (TypeError, ValueError):
-                    continue
-
-        unlocks: Dict[str, bool] = {}
-        raw_unlocks = data.get("unlocks", {})
-        if isinstance(raw_unlocks, Mapping):
-            for key, value in raw_unlocks.items():
-                unlocks[key] = bool(value)
-
-        settings_data = data.get("settings", {})
-        if isinstance(settings_data, Mapping):
-            settings = SettingsState.from_mapping(settings_data)
+    def to_sections(self) -> Dict[str, object]:
+        """Detached container sections; sections never read are passed through raw."""
+
+        lazy = self.__dict__.get("_lazy") or {}
+        sections: Dict[str, object] = {
+            "core": {"credits": self.credits, "settings": self.settings.to_dict(), "unlocks": dict(self.unlocks)},
+        }
+        if "purchased" in lazy:
+            sections["purchased"] = lazy["purchased"]
+        else:
+            sections["purchased"] = {name: dict(levels) for name, levels in self.purchased.items()}
+        if "achievements" in lazy:
+            sections["achievements"] = lazy["achievements"]
         else:
-            settings = SettingsState()
+            sections["achievements"] = {key: record.to_dict() for key, record in self.achievements.items()}
+        sections["statistics"] = lazy["statistics"] if "statistics" in lazy else dict(self.statistics)
+        return sections
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, object]) -> "ProgressState":
         state = cls(
-            credits=credits,
-            purchased=purchased,
-            achievements=achievements,
-            statistics=statistics,
-            unlocks=unlocks,
-            settings=settings,
+            credits=int(data.get("credits", 0)),
+            purchased=_parse_purchased(data.get("purchased", {})),
+            achievements=_parse_achievements(data.get("achievements", {})),
+            statistics=_parse_statistics(data.get("statistics", {})),
+            unlocks=_parse_unlocks(data.get("unlocks", {})),
+            settings=_parse_settings(data.get("settings", {})),
         )
         state.ensure_statistics()
         return state
 
+    @classmethod
+    def from_sections(
+        cls, sections: Mapping[str, RawSection], characters: Iterable[CharacterProfile] = ()
+    ) -> "ProgressState":
+        """Decode the core section now and defer the rest to first access."""
+
+        core = sections["core"].decode() if "core" in sections else {}
+        if not isinstance(core, Mapping):
+            raise SaveFormatError("core section is not a mapping")
+        state = cls(
+            credits=int(core.get("credits", 0)),
+            unlocks=_parse_unlocks(core.get("unlocks", {})),
+            settings=_parse_settings(core.get("settings", {})),
+        )
+        for name in LAZY_SECTIONS:
+            del state.__dict__[name]
+        state.__dict__["_characters"] = tuple(characters)
+        state.__dict__["_lazy"] = {name: sections.get(name) or encode_section({}) for name in LAZY_SECTIONS}
+        return state
 
-def load_progress(characters: Iterable[CharacterProfile]) -> ProgressState:
-    """Load the persisted meta-progression file if it exists."""
 
-    if SAVE_PATH.exists():
-        try:
-            data = json.loads(SAVE_PATH.read_text())
-            state = ProgressState.from_mapping(data)
-        except (json.JSONDecodeError, OSError):
-            state = ProgressState()
-    else:
-        state = ProgressState()
+def _fresh_progress(characters: Iterable[CharacterProfile]) -> ProgressState:
+    state = ProgressState()
     state.ensure_character(characters)
     state.ensure_statistics()
     state.ensure_achievements()
     return state
 
 
-def save_progress(state: ProgressState) -> None:
-    """Persist the player's progress to disk."""
+def load_progress(characters: Iterable[CharacterProfile]) -> ProgressState:
+    """Load the persisted meta-progression file if it exists.
+
+    Only settings, credits and unlocks are decoded here; upgrades,
+    achievements and statistics decode when first read. A JSON save from
+    older builds is migrated on first load.
+    """
+
+    characters = tuple(characters)
+    if SAVE_PATH.exists():
+        try:
+            return ProgressState.from_sections(unpack(SAVE_PATH.read_bytes()), characters)
+        except (SaveFormatError, OSError):
+            return _fresh_progress(characters)
+    if LEGACY_SAVE_PATH.exists():
+        migrated = migrate_legacy_save(characters)
+        if migrated is not None:
+            return migrated
+    return _fresh_progress(characters)
 
+
+def migrate_legacy_save(characters: Iterable[CharacterProfile]) -> Optional[ProgressState]:
+    """One-way conversion of the JSON save into the sectioned container.
+
+    The JSON file is kept as ``.descent_progress.json.bak`` once the new save
+    is on disk, so older builds no longer see (and overwrite) it.
+    """
+
+    try:
+        state = ProgressState.from_mapping(json.loads(LEGACY_SAVE_PATH.read_text()))
+    except (json.JSONDecodeError, OSError):
+        return None
+    state.ensure_character(characters)
+    state.ensure_achievements()
     try:
-        SAVE_PATH.write_text(json.dumps(state.to_dict(), indent=2))
+        write_atomic(SAVE_PATH, pack(state.to_sections()))
+        LEGACY_SAVE_PATH.replace(LEGACY_SAVE_PATH.with_name(LEGACY_SAVE_PATH.name + ".bak"))
     except OSError:
-        # Failing to write the save file should not crash the game.
         pass
+    return state
+
+
+class ProgressWriter:
+    """Debounced write-behind persistence for the progress file.
+
+    :meth:`request` only stores the newest snapshot and wakes the worker
+    thread, so callers on the frame thread never wait on the disk. Only one
+    write is ever in flight; snapshots requested meanwhile replace each other
+    and the latest one is written next.
+    """
+
+    def __init__(self, debounce: float = SAVE_DEBOUNCE, max_delay: float = SAVE_MAX_DELAY) -> None:
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.requests = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.failures = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self._condition = threading.Condition()
+        self._pending: Optional[Dict[str, object]] = None
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._writing = False
+        self._thread: Optional[threading.Thread] = None
+        self._registered = False
+
+    def request(self, snapshot: Dict[str, object]) -> None:
+        with self._condition:
+            now = time.monotonic()
+            if self._pending is None:
+                self._first_request = now
+            else:
+                self.coalesced += 1
+            self._pending = snapshot
+            self._last_request = now
+            self.requests += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="descent-save", daemon=True)
+                self._thread.start()
+            if not self._registered:
+                atexit.register(self.flush)
+                self._registered = True
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._pending is None or self._writing:
+                        self._condition.wait()
+                        continue
+                    due = min(self._last_request + self.debounce, self._first_request + self.max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                snapshot = self._take()
+            self._write(snapshot)
+
+    def _take(self) -> Dict[str, object]:
+        # Caller holds the condition.
+        snapshot, self._pending = self._pending, None
+        self._writing = True
+        return snapshot
+
+    def _write(self, snapshot: Dict[str, object]) -> None:
+        started = time.perf_counter()
+        try:
+            write_atomic(SAVE_PATH, pack(snapshot))
+        except OSError:
+            # Failing to write the save file should not crash the game.
+            self.failures += 1
+        else:
+            elapsed = (time.perf_counter() - started) * 1000.0
+            self.flushes += 1
+            self.last_flush_ms = elapsed
+            self.max_flush_ms = max(self.max_flush_ms, elapsed)
+            self.total_flush_ms += elapsed
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Write any pending snapshot on the calling thread and wait for it."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writing)
+            if self._pending is None:
+                return
+            snapshot = self._take()
+        self._write(snapshot)
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None or self._writing
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "mean_flush_ms": round(self.total_flush_ms / self.flushes, 3) if self.flushes else 0.0,
+        }
+
+
+PROGRESS_WRITER = ProgressWriter()
+
+
+def save_progress(state: ProgressState) -> None:
+    """Queue the player's progress for a debounced background write."""
+
+    PROGRESS_WRITER.request(state.to_sections())
+
+
+def flush_progress() -> None:
+    """Block until every queued save has reached the disk."""
+
+    PROGRESS_WRITER.flush()
 
 
 def update_settings(state: ProgressState, key: str, value: object) -> None:
@@ -310,8 +557,8 @@ def update_settings(state: ProgressState, key: str, value: object) -> None:
         save_progress(state)
 
 
-def record_statistics(state: ProgressState, updates: Mapping[str, float]) -> None:
-    """Accumulate statistics in the persistent profile."""
+def record_statistics(state: ProgressState, updates: Mapping[str, float]) -> List["AchievementDefinition"]:
+    """Accumulate statistics and unlock total-scope achievements watching them."""
 
     state.ensure_statistics()
     for key, value in updates.items():
@@ -319,18 +566,66 @@ def record_statistics(state: ProgressState, updates: Mapping[str, float]) -> Non
             state.statistics[key] = max(state.statistics.get(key, 0), float(value))
         else:
             state.statistics[key] = state.statistics.get(key, 0) + float(value)
+    return publish_metrics(state, "total", {key: state.statistics[key] for key in updates})
 
 
 def count_unlocked(state: ProgressState) -> int:
     return sum(1 for record in state.achievements.values() if record.unlocked)
 
 
+def meta_counts(state: ProgressState) -> Dict[str, int]:
+    """Values of the meta-scope metrics, counted once and then kept incrementally."""
+
+    if state.meta_counts is None:
+        maxed_tracks = 0
+        divers = 0
+        for upgrades in state.purchased.values():
+            if any(level > 0 for level in upgrades.values()):
+                divers += 1
+            for key, level in upgrades.items():
+                definition = UPGRADE_DEFINITIONS.get(key)
+                if definition and level >= definition.max_level:
+                    maxed_tracks += 1
+        state.meta_counts = {"maxed_tracks": maxed_tracks, "divers_with_upgrades": divers}
+    return state.meta_counts
+
+
+def publish_metrics(state: ProgressState, scope: str, values: Mapping[str, float]) -> List["AchievementDefinition"]:
+    """Unlock the ``scope`` achievements that watch ``values`` and now pass.
+
+    Only definitions subscribed to a published metric are looked at, and each
+    metric's walk stops at the first threshold the value has not reached.
+    """
+
+    from .achievements import ACHIEVEMENT_INDEX
+
+    unlocked: List["AchievementDefinition"] = []
+    for metric, value in values.items():
+        for definition in ACHIEVEMENT_INDEX.watching(scope, metric):
+            if float(value) < definition.threshold:
+                break
+            record = state.achievements.get(definition.key)
+            if record is None:
+                record = AchievementRecord()
+                state.achievements[definition.key] = record
+            if record.unlocked:
+                continue
+            record.unlocked = True
+            record.timestamp = datetime.utcnow().isoformat()
+            state.statistics["achievements_unlocked"] = float(count_unlocked(state))
+            unlocked.append(definition)
+            if state.on_unlock:
+                state.on_unlock(definition)
+            if definition.reward_credits:
+                state.credits += definition.reward_credits
+                unlocked.extend(record_statistics(state, {"credits_earned": definition.reward_credits}))
+    return unlocked
+
+
 def record_run(state: ProgressState, run_stats: Mapping[str, float]) -> list["AchievementDefinition"]:
     """Apply a run summary to persistent stats and unlock achievements."""
 
-    from .achievements import ACHIEVEMENTS
-
-    record_statistics(
+    unlocked = record_statistics(
         state,
         {
             "runs_played": 1,
@@ -343,7 +638,7 @@ def record_run(state: ProgressState, run_stats: Mapping[str, float]) -> list["Ac
             "credits_earned": run_stats.get("credits", 0),
         },
     )
-    record_statistics(
+    unlocked += record_statistics(
         state,
         {
             "highest_combo": run_stats.get("combo", 0),
@@ -352,26 +647,10 @@ def record_run(state: ProgressState, run_stats: Mapping[str, float]) -> list["Ac
         },
     )
 
-    unlocked: list["AchievementDefinition"] = []
-    totals = state.statistics
-    now = datetime.utcnow().isoformat()
-    for key, definition in ACHIEVEMENTS.items():
-        record = state.achievements.get(key)
-        if record is None:
-            record = AchievementRecord()
-            state.achievements[key] = record
-        if record.unlocked:
-            continue
-        if definition.is_met(run_stats, totals, state):
-            record.unlocked = True
-            record.timestamp = now
-            if definition.reward_credits:
-                state.credits += definition.reward_credits
-                record_statistics(state, {"credits_earned": definition.reward_credits})
-            unlocked.append(definition)
-
-    state.ensure_statistics()
-    state.statistics["achievements_unlocked"] = float(count_unlocked(state))
+    unlocked += publish_metrics(state, "run", run_stats)
+    # Meta counts only move on purchases; re-publishing them here also picks
+    # up profiles that met a threshold before achievements were tracked.
+    unlocked += publish_metrics(state, "meta", meta_counts(state))
     save_progress(state)
     return unlocked
 
@@ -417,9 +696,15 @@ def purchase_upgrade(state: ProgressState, character: CharacterProfile, upgrade_
     cost = definition.cost_for_level(level)
     if state.credits < cost:
         return False, "Insufficient credits."
+    counts = meta_counts(state)
+    if not any(value > 0 for value in char_upgrades.values()):
+        counts["divers_with_upgrades"] += 1
     state.credits -= cost
     char_upgrades[upgrade_key] = level + 1
+    if level + 1 >= definition.max_level:
+        counts["maxed_tracks"] += 1
     record_statistics(state, {"upgrades_purchased": 1})
+    publish_metrics(state, "meta", counts)
     save_progress(state)
     return True, f"Purchased {definition.label} Lv.{level + 1}!"
 
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+"""Preallocated translucent overlays for pause, game-over and toasts.
+
+The pause veil, the dimmed HUD and the game-over screen each used to build a
+full-screen SRCALPHA surface every frame, and achievement toasts built a
+fresh card per toast per frame. :class:`OverlayCompositor` owns those
+surfaces instead: veils are filled once per (color, alpha), toast cards are
+baked per (text, alpha bucket) with LRU eviction, and the frozen pause
+snapshot reuses a single screen-sized buffer. ``allocations`` counts every
+surface it creates, so a flat counter confirms a steady state without
+per-frame allocation.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+import pygame
+
+from .constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+Color = Tuple[int, int, int]
+
+TOAST_CACHE_LIMIT = 64
+# Toast fades are quantized to this many alpha steps so a fading card maps
+# onto a handful of cached surfaces instead of one per frame.
+TOAST_ALPHA_STEP = 8
+TOAST_BORDER_RADIUS = 12
+
+
+class OverlayCompositor:
+    def __init__(
+        self,
+        size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        max_toasts: int = TOAST_CACHE_LIMIT,
+    ) -> None:
+        self.size = size
+        self.max_toasts = max(1, int(max_toasts))
+        self.allocations = 0
+        self.toast_hits = 0
+        self.toast_misses = 0
+        self._veils: Dict[Tuple[Color, int], pygame.Surface] = {}
+        self._toasts: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._snapshot: Optional[pygame.Surface] = None
+
+    def _allocate(self, size: Tuple[int, int], flags: int = 0) -> pygame.Surface:
+        self.allocations += 1
+        surface = pygame.Surface(size, flags)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert()
+        return surface
+
+    def veil(self, target: pygame.Surface, alpha: int, color: Color = (0, 0, 0)) -> None:
+        """Darken the whole target with a uniform translucent layer."""
+
+        key = (tuple(color), int(alpha))
+        surface = self._veils.get(key)
+        if surface is None:
+            surface = self._allocate(self.size, pygame.SRCALPHA)
+            surface.fill((*key[0], key[1]))
+            self._veils[key] = surface
+        target.blit(surface, (0, 0))
+
+    def toast(
+        self,
+        target: pygame.Surface,
+        rect: pygame.Rect,
+        label: pygame.Surface,
+        text: str,
+        alpha: int,
+        colors: Mapping[str, Color],
+    ) -> None:
+        """Blit a toast card with ``label`` centered, baking it on first use."""
+
+        bucket = int(alpha) // TOAST_ALPHA_STEP * TOAST_ALPHA_STEP
+        key = (text, bucket, rect.size, colors["ui_bg"], colors["ui_accent"], colors["loot"])
+        card = self._toasts.get(key)
+        if card is not None:
+            self.toast_hits += 1
+            self._toasts.move_to_end(key)
+        else:
+            self.toast_misses += 1
+            card = self._allocate(rect.size, pygame.SRCALPHA)
+            card.fill((*colors["ui_bg"], bucket))
+            bounds = card.get_rect()
+            pygame.draw.rect(card, colors["ui_accent"], bounds, 2, border_radius=TOAST_BORDER_RADIUS)
+            card.blit(label, label.get_rect(center=bounds.center))
+            self._toasts[key] = card
+            if len(self._toasts) > self.max_toasts:
+                self._toasts.popitem(last=False)
+        target.blit(card, rect)
+
+    def snapshot(self, source: pygame.Surface) -> pygame.Surface:
+        """Copy ``source`` into a reused buffer (the frozen pause backdrop)."""
+
+        if self._snapshot is None or self._snapshot.get_size() != source.get_size():
+            self.allocations += 1
+            self._snapshot = source.copy()
+        else:
+            self._snapshot.blit(source, (0, 0))
+        return self._snapshot
+
+    def clear(self) -> None:
+        self._veils.clear()
+        self._toasts.clear()
+        self._snapshot = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "allocations": self.allocations,
+            "veils": len(self._veils),
+            "toasts": len(self._toasts),
+            "toast_hits": self.toast_hits,
+            "toast_misses": self.toast_misses,
+        }
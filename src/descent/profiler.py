@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+"""Frame-phase instrumentation with an on-screen overlay and trace export.
+
+The game loop marks phase boundaries with :meth:`FrameProfiler.lap`; each
+lap closes the previous phase, so instrumenting a long method never needs
+re-indentation. Per-frame totals feed a rolling window per phase from which
+the overlay reports p50/p95/p99, and when tracing is on every phase is also
+recorded as a Chrome trace event (load the exported JSON in
+``chrome://tracing`` or Perfetto). A disabled profiler returns from every
+hook after a single attribute check.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pygame
+
+PROFILER_WINDOW = 240
+MAX_TRACE_EVENTS = 500_000
+# The overlay text is rebuilt every this many frames rather than per frame.
+OVERLAY_REFRESH_FRAMES = 15
+OVERLAY_FONT_SIZE = 18
+OVERLAY_WIDTH = 330
+FRAME_PHASE = "frame"
+
+
+class PhaseHistogram:
+    """Fixed-size ring of the most recent per-frame samples, in milliseconds."""
+
+    def __init__(self, window: int = PROFILER_WINDOW) -> None:
+        self.samples = np.zeros(max(1, int(window)), dtype=np.float64)
+        self.count = 0
+        self._cursor = 0
+
+    def add(self, value_ms: float) -> None:
+        self.samples[self._cursor] = value_ms
+        self._cursor = (self._cursor + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+
+    def percentiles(self, quantiles: Tuple[float, ...] = (50, 95, 99)) -> Tuple[float, ...]:
+        if self.count == 0:
+            return tuple(0.0 for _ in quantiles)
+        return tuple(float(value) for value in np.percentile(self.samples[: self.count], quantiles))
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        enabled: bool = False,
+        tracing: bool = False,
+        window: int = PROFILER_WINDOW,
+        max_trace_events: int = MAX_TRACE_EVENTS,
+    ) -> None:
+        self.enabled = enabled or tracing
+        self.tracing = tracing
+        self.window = window
+        self.max_trace_events = max_trace_events
+        self.overlay_visible = False
+        self.frames = 0
+        self.histograms: Dict[str, PhaseHistogram] = {}
+        self.trace_events: List[Dict[str, object]] = []
+        self._origin = time.perf_counter_ns()
+        self._frame_start = 0
+        self._phase: Optional[str] = None
+        self._phase_start = 0
+        self._totals: Dict[str, int] = {}
+        self._font: Optional[pygame.font.Font] = None
+        self._panel: Optional[pygame.Surface] = None
+
+    def toggle_overlay(self) -> None:
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        self._panel = None
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter_ns()
+        self._phase = None
+        self._totals.clear()
+
+    def lap(self, phase: str) -> None:
+        """Close the current phase and start timing ``phase``."""
+
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self._close_phase(now)
+        self._phase = phase
+        self._phase_start = now
+
+    def end_frame(self) -> None:
+        if not self.enabled or not self._frame_start:
+            return
+        now = time.perf_counter_ns()
+        self._close_phase(now)
+        self._phase = None
+        for phase, total in self._totals.items():
+            self._histogram(phase).add(total / 1e6)
+        self._histogram(FRAME_PHASE).add((now - self._frame_start) / 1e6)
+        self._record(FRAME_PHASE, self._frame_start, now - self._frame_start)
+        self.frames += 1
+
+    def _close_phase(self, now: int) -> None:
+        if self._phase is None:
+            return
+        elapsed = now - self._phase_start
+        self._totals[self._phase] = self._totals.get(self._phase, 0) + elapsed
+        self._record(self._phase, self._phase_start, elapsed)
+
+    def _record(self, name: str, start: int, duration: int) -> None:
+        if not self.tracing or len(self.trace_events) >= self.max_trace_events:
+            return
+        self.trace_events.append(
+            {
+                "name": name,
+                "cat": FRAME_PHASE if name == FRAME_PHASE else "phase",
+                "ph": "X",
+                "ts": (start - self._origin) / 1000.0,
+                "dur": duration / 1000.0,
+                "pid": 1,
+                "tid": 1,
+            }
+        )
+
+    def _histogram(self, phase: str) -> PhaseHistogram:
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = PhaseHistogram(self.window)
+            self.histograms[phase] = histogram
+        return histogram
+
+    def summary(self) -> Dict[str, Tuple[float, ...]]:
+        """Return ``{phase: (p50, p95, p99)}`` in milliseconds."""
+
+        return {phase: histogram.percentiles() for phase, histogram in self.histograms.items()}
+
+    def export_trace(self, path: Union[str, Path]) -> int:
+        """Write the recorded session as Chrome trace-event JSON."""
+
+        payload = {"traceEvents": self.trace_events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(payload))
+        return len(self.trace_events)
+
+    def draw_overlay(self, surface: pygame.Surface, counts: Mapping[str, int]) -> Optional[pygame.Rect]:
+        """Blit the percentile panel in the bottom-right corner."""
+
+        if not self.overlay_visible:
+            return None
+        if self._panel is None or self.frames % OVERLAY_REFRESH_FRAMES == 0:
+            self._panel = self._render_panel(counts)
+        rect = self._panel.get_rect(bottomright=(surface.get_width() - 10, surface.get_height() - 10))
+        return surface.blit(self._panel, rect)
+
+    def _render_panel(self, counts: Mapping[str, int]) -> pygame.Surface:
+        if self._font is None:
+            self._font = pygame.font.Font(None, OVERLAY_FONT_SIZE)
+        rows = [("phase", "p50", "p95", "p99")]
+        for phase in sorted(self.histograms, key=lambda name: name != FRAME_PHASE):
+            rows.append((phase, *(f"{value:.2f}" for value in self.histograms[phase].percentiles())))
+        footer = "  ".join(f"{name} {value}" for name, value in counts.items())
+        line_height = self._font.get_linesize()
+        panel = pygame.Surface((OVERLAY_WIDTH, line_height * (len(rows) + 1) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        # The default font is proportional, so numbers are right-aligned per column.
+        for index, row in enumerate(rows):
+            color = (255, 208, 96) if index == 0 else (220, 220, 220)
+            y = 6 + index * line_height
+            panel.blit(self._font.render(row[0], True, color), (8, y))
+            for column, cell in enumerate(row[1:]):
+                text = self._font.render(cell, True, color)
+                panel.blit(text, text.get_rect(topright=(OVERLAY_WIDTH - 8 - (2 - column) * 60, y)))
+        panel.blit(self._font.render(footer, True, (186, 255, 201)), (8, 6 + len(rows) * line_height))
+        return panel
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+"""Structure-of-arrays projectile engine.
+
+Every bullet in a run - weapon fire, nova volleys and drone shots - lives in
+one :class:`ProjectileField`. Positions, velocities, damage, color index and
+remaining lifetime are stored in contiguous NumPy arrays so integration,
+culling and hit tests run as single vectorized steps instead of one sprite
+update per projectile.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from .art import projectile_sprite
+from .constants import SPATIAL_CELL_SIZE
+
+Color = Tuple[int, int, int]
+
+PROJECTILE_RADIUS = 8.0
+# Shots live until they leave the arena, as the sprite projectiles did; pass
+# an explicit ``lifetime`` to make a volley fizzle early.
+PROJECTILE_LIFETIME = float("inf")
+_CELL_STRIDE = 1 << 24
+_CELL_OFFSET = 1 << 23
+
+
+class ProjectileField:
+    def __init__(self, capacity: int = 256) -> None:
+        capacity = max(16, int(capacity))
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.zeros(capacity, dtype=np.float64)
+        self.colors: List[Color] = []
+        self._color_lookup: Dict[Color, int] = {}
+        self._sprites: List[pygame.Surface] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return self.position.shape[0]
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _color_slot(self, color: Sequence[int]) -> int:
+        key = (int(color[0]), int(color[1]), int(color[2]))
+        slot = self._color_lookup.get(key)
+        if slot is None:
+            slot = len(self.colors)
+            self.colors.append(key)
+            self._color_lookup[key] = slot
+        return slot
+
+    def _reserve(self, extra: int) -> int:
+        start = self.count
+        needed = start + extra
+        if needed > self.capacity:
+            size = self.capacity
+            while size < needed:
+                size *= 2
+            for name in ("position", "velocity", "damage", "color_index", "lifetime"):
+                old = getattr(self, name)
+                grown = np.zeros((size,) + old.shape[1:], dtype=old.dtype)
+                grown[:start] = old[:start]
+                setattr(self, name, grown)
+        self.count = needed
+        return start
+
+    def spawn(
+        self,
+        position: Sequence[float],
+        direction: Sequence[float],
+        speed: float,
+        damage: float,
+        color: Sequence[int],
+        lifetime: float = PROJECTILE_LIFETIME,
+    ) -> None:
+        dx, dy = float(direction[0]), float(direction[1])
+        length = (dx * dx + dy * dy) ** 0.5
+        if length == 0:
+            return
+        slot = self._reserve(1)
+        self.position[slot] = (position[0], position[1])
+        self.velocity[slot] = (dx / length * speed, dy / length * speed)
+        self.damage[slot] = damage
+        self.color_index[slot] = self._color_slot(color)
+        self.lifetime[slot] = lifetime
+
+    def spawn_ring(
+        self,
+        center: Sequence[float],
+        count: int,
+        speed: float,
+        damage: float,
+        color: Sequence[int],
+        lifetime: float = PROJECTILE_LIFETIME,
+    ) -> None:
+        """Spawn ``count`` projectiles evenly spaced around ``center``."""
+
+        if count <= 0:
+            return
+        angles = np.arange(count, dtype=np.float64) * (np.pi * 2.0 / count)
+        start = self._reserve(count)
+        end = start + count
+        self.position[start:end] = (center[0], center[1])
+        self.velocity[start:end, 0] = np.cos(angles) * speed
+        self.velocity[start:end, 1] = np.sin(angles) * speed
+        self.damage[start:end] = damage
+        self.color_index[start:end] = self._color_slot(color)
+        self.lifetime[start:end] = lifetime
+
+    def step(self, dt: float, bounds: pygame.Rect) -> None:
+        """Integrate every projectile and cull expired or out-of-bounds ones."""
+
+        n = self.count
+        if n == 0:
+            return
+        position = self.position[:n]
+        position += self.velocity[:n] * dt
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        dead = (
+            (lifetime <= 0)
+            | (position[:, 0] < bounds.left)
+            | (position[:, 0] > bounds.right)
+            | (position[:, 1] < bounds.top)
+            | (position[:, 1] > bounds.bottom)
+        )
+        self._remove(dead)
+
+    def collide(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve hits against axis-aligned ``boxes`` shaped ``(N, 4)``.
+
+        Boxes are ``(left, top, right, bottom)``. Each projectile is treated
+        as a circle of :data:`PROJECTILE_RADIUS`, hits at most one box (the
+        lowest index) and is removed on contact. Returns the indices of the
+        boxes that were hit and the summed damage each received.
+
+        Boxes are bucketed into a uniform grid first, so the exact
+        circle/AABB test only runs on projectile/box pairs sharing a cell.
+        """
+
+        n = self.count
+        empty = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64))
+        if n == 0 or len(boxes) == 0:
+            return empty
+        boxes = np.asarray(boxes, dtype=np.float64)
+        m = len(boxes)
+        radius = PROJECTILE_RADIUS
+        size = float(SPATIAL_CELL_SIZE)
+
+        # Cells covered by each box grown by the projectile radius.
+        x0 = np.floor((boxes[:, 0] - radius) / size).astype(np.int64)
+        y0 = np.floor((boxes[:, 1] - radius) / size).astype(np.int64)
+        width = np.floor((boxes[:, 2] + radius) / size).astype(np.int64) - x0 + 1
+        height = np.floor((boxes[:, 3] + radius) / size).astype(np.int64) - y0 + 1
+        box_ids, offsets = _expand(width * height)
+        cell_keys = _cell_key(
+            x0[box_ids] + offsets % width[box_ids],
+            y0[box_ids] + offsets // width[box_ids],
+        )
+        order = np.argsort(cell_keys, kind="stable")
+        cell_keys = cell_keys[order]
+        box_ids = box_ids[order]
+
+        position = self.position[:n]
+        probe = _cell_key(
+            np.floor(position[:, 0] / size).astype(np.int64),
+            np.floor(position[:, 1] / size).astype(np.int64),
+        )
+        lo = np.searchsorted(cell_keys, probe, side="left")
+        hi = np.searchsorted(cell_keys, probe, side="right")
+        pair_projectiles, pair_offsets = _expand(hi - lo)
+        if len(pair_projectiles) == 0:
+            return empty
+        pair_boxes = box_ids[lo[pair_projectiles] + pair_offsets]
+
+        px = position[pair_projectiles, 0]
+        py = position[pair_projectiles, 1]
+        candidates = boxes[pair_boxes]
+        dx = px - np.clip(px, candidates[:, 0], candidates[:, 2])
+        dy = py - np.clip(py, candidates[:, 1], candidates[:, 3])
+        overlap = dx * dx + dy * dy <= radius * radius
+        if not overlap.any():
+            return empty
+        target = np.full(n, m, dtype=np.intp)
+        np.minimum.at(target, pair_projectiles[overlap], pair_boxes[overlap])
+        hit = target < m
+        totals = np.bincount(target[hit], weights=self.damage[:n][hit], minlength=m)
+        self._remove(hit)
+        struck = np.flatnonzero(totals > 0)
+        return struck, totals[struck]
+
+    def _remove(self, dead: np.ndarray) -> None:
+        """Swap-remove the slots flagged in ``dead`` (a mask over live slots)."""
+
+        n = self.count
+        dead_count = int(np.count_nonzero(dead))
+        if dead_count == 0:
+            return
+        keep = n - dead_count
+        holes = np.flatnonzero(dead[:keep])
+        fillers = keep + np.flatnonzero(~dead[keep:])
+        if len(holes):
+            for array in (self.position, self.velocity, self.damage, self.color_index, self.lifetime):
+                array[holes] = array[fillers]
+        self.count = keep
+
+    def draw(self, surface: pygame.Surface, collect_rects: bool = False) -> List[pygame.Rect]:
+        """Blit every projectile; return the touched rects if requested."""
+
+        n = self.count
+        if n == 0:
+            return []
+        sprites = self._sprites
+        # Sprites resolve lazily so the field can run without a display.
+        while len(sprites) < len(self.colors):
+            sprites.append(projectile_sprite(self.colors[len(sprites)]))
+        half = [(sprite.get_width() / 2, sprite.get_height() / 2) for sprite in sprites]
+        rects = surface.blits(
+            [
+                (sprites[index], (x - half[index][0], y - half[index][1]))
+                for (x, y), index in zip(self.position[:n].tolist(), self.color_index[:n].tolist())
+            ],
+            doreturn=collect_rects,
+        )
+        return rects or []
+
+
+def _expand(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(owner, offset)`` pairs enumerating ``range(count)`` per owner."""
+
+    owners = np.repeat(np.arange(len(counts), dtype=np.intp), counts)
+    starts = np.cumsum(counts) - counts
+    offsets = np.arange(len(owners), dtype=np.int64) - np.repeat(starts, counts)
+    return owners, offsets
+
+
+def _cell_key(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    return (cx + _CELL_OFFSET) * _CELL_STRIDE + (cy + _CELL_OFFSET)
+
+
+def enemy_boxes(enemies: Sequence[pygame.sprite.Sprite]) -> np.ndarray:
+    """Return ``(left, top, right, bottom)`` rows for each sprite's rect."""
+
+    if not enemies:
+        return np.zeros((0, 4), dtype=np.float64)
+    return np.array(
+        [(e.rect.left, e.rect.top, e.rect.right, e.rect.bottom) for e in enemies],
+        dtype=np.float64,
+    )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+"""Opt-in dirty-rectangle presentation for the running state.
+
+Instead of refilling and flipping the whole window each frame,
+:class:`DirtyRectRenderer` restores only last frame's sprite rects from the
+cached arena background and pushes the union of old and new rects to the
+display with ``pygame.display.update``. When the dirty area grows past a
+threshold, a full flip is cheaper, so the renderer falls back to one.
+"""
+
+from typing import Iterable, List, Optional
+
+import pygame
+
+DIRTY_AREA_THRESHOLD = 0.45
+
+
+def draw_group(surface: pygame.Surface, sprites: Iterable[pygame.sprite.Sprite]) -> List[pygame.Rect]:
+    """Blit every sprite and return the rects that were touched."""
+
+    return surface.blits([(sprite.image, sprite.rect) for sprite in sprites]) or []
+
+
+class DirtyRectRenderer:
+    def __init__(self, threshold: float = DIRTY_AREA_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.full_frames = 0
+        self.partial_frames = 0
+        self._previous: List[pygame.Rect] = []
+        self._force_full = True
+
+    def invalidate(self) -> None:
+        """Force the next frame to redraw and flip the whole window."""
+
+        self._force_full = True
+
+    def begin(self, screen: pygame.Surface, background: pygame.Surface) -> None:
+        """Erase last frame's rects, or the whole screen after invalidation."""
+
+        if self._force_full:
+            screen.blit(background, (0, 0))
+            return
+        bounds = screen.get_rect()
+        screen.blits(
+            [(background, rect, rect) for rect in (r.clip(bounds) for r in self._previous) if rect.width and rect.height],
+            doreturn=False,
+        )
+
+    def present(self, screen: pygame.Surface, drawn: Iterable[Optional[pygame.Rect]]) -> None:
+        bounds = screen.get_rect()
+        current = [pygame.Rect(rect).clip(bounds) for rect in drawn if rect]
+        current = [rect for rect in current if rect.width and rect.height]
+        # Fixed regions (the HUD) show up in both frames; count them once.
+        dirty = list({tuple(rect): rect for rect in self._previous + current}.values())
+        area = sum(rect.width * rect.height for rect in dirty)
+        if self._force_full or area > bounds.width * bounds.height * self.threshold:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self._previous = current
+        self._force_full = False
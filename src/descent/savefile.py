@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+"""Versioned, sectioned binary container for the progress file.
+
+Layout (little-endian)::
+
+    header   4s magic "DSAV" | u16 format version | u16 section count
+    table    per section: 16s name | u8 codec | u32 offset | u32 length
+    payload  section bodies, in table order
+
+Each body is compact UTF-8 JSON, zlib-compressed once it passes
+``COMPRESS_THRESHOLD`` bytes. :func:`unpack` only validates the header and
+slices the bodies into :class:`RawSection` objects; nothing is decoded until
+:meth:`RawSection.decode` is called, so a large history section costs a
+memory copy rather than a parse at startup. Undecoded sections can be handed
+straight back to :func:`pack` and are written out byte-for-byte. The same
+container holds the compiled content cache (:mod:`descent.content`), which is
+unpacked straight out of a memory map without copying.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Union
+
+MAGIC = b"DSAV"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<16sBII")
+CODEC_JSON = 0
+CODEC_ZLIB_JSON = 1
+COMPRESS_THRESHOLD = 4096
+
+
+class SaveFormatError(ValueError):
+    """Raised for truncated, foreign or newer-than-supported containers."""
+
+
+@dataclass(frozen=True)
+class RawSection:
+    codec: int
+    payload: Union[bytes, memoryview]
+
+    def decode(self) -> object:
+        try:
+            body = zlib.decompress(self.payload) if self.codec == CODEC_ZLIB_JSON else self.payload
+            return json.loads(str(body, "utf-8"))
+        except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise SaveFormatError(f"corrupt section: {exc}") from exc
+
+
+def encode_section(value: object) -> RawSection:
+    body = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    if len(body) >= COMPRESS_THRESHOLD:
+        return RawSection(CODEC_ZLIB_JSON, zlib.compress(body, 6))
+    return RawSection(CODEC_JSON, body)
+
+
+def pack(sections: Mapping[str, Union[object, RawSection]]) -> bytes:
+    """Encode ``sections`` in iteration order; the first is read first on load."""
+
+    encoded = [
+        (name, value if isinstance(value, RawSection) else encode_section(value))
+        for name, value in sections.items()
+    ]
+    offset = HEADER.size + ENTRY.size * len(encoded)
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded))]
+    for name, section in encoded:
+        label = name.encode("ascii")
+        if len(label) > 16:
+            raise ValueError(f"section name too long: {name}")
+        parts.append(ENTRY.pack(label, section.codec, offset, len(section.payload)))
+        offset += len(section.payload)
+    parts.extend(section.payload for _, section in encoded)
+    return b"".join(parts)
+
+
+def is_container(data: bytes) -> bool:
+    return data[: len(MAGIC)] == MAGIC
+
+
+def unpack(data: Union[bytes, memoryview], copy: bool = True) -> Dict[str, RawSection]:
+    """Split a container into its undecoded sections.
+
+    ``data`` may be any byte buffer, such as an ``mmap``. With ``copy=False``
+    the payloads are memoryview slices of it, so it must stay open (and
+    unmodified) while the sections are in use.
+    """
+
+    if len(data) < HEADER.size or not is_container(data):
+        raise SaveFormatError("not a Descent save container")
+    _, version, count = HEADER.unpack_from(data)
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"save format {version} is newer than supported ({FORMAT_VERSION})")
+    if HEADER.size + ENTRY.size * count > len(data):
+        raise SaveFormatError("truncated section table")
+    view = memoryview(data)
+    sections: Dict[str, RawSection] = {}
+    for index in range(count):
+        label, codec, offset, length = ENTRY.unpack_from(data, HEADER.size + ENTRY.size * index)
+        if offset + length > len(data):
+            raise SaveFormatError("truncated section body")
+        if codec not in (CODEC_JSON, CODEC_ZLIB_JSON):
+            raise SaveFormatError(f"unknown section codec {codec}")
+        try:
+            name = label.rstrip(b"\0").decode("ascii")
+        except UnicodeDecodeError as exc:
+            raise SaveFormatError(f"malformed section label: {exc}") from exc
+        payload = view[offset : offset + length]
+        sections[name] = RawSection(codec, bytes(payload) if copy else payload)
+    return sections
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temporary sibling, fsync it, then rename over ``path``."""
+
+    handle, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            stream.write(data)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
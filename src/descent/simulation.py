@@ -0,0 +1,771 @@
+from __future__ import annotations
+
+"""Headless run simulation.
+
+:class:`Simulation` owns everything that happens during a dive: the player
+and weapon, enemies and waves, pickups, relics, abilities, combo and dynamic
+events. It never touches the display, fonts, the save file or live input;
+each :meth:`Simulation.step` advances one fixed tick from an
+:class:`InputCommand`, so runs can be driven faster than real time by
+scripts and benchmarks. :class:`~descent.game.Game` renders a simulation and
+translates keyboard and mouse state into commands.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import pygame
+
+from .abilities import ABILITIES, AbilityProfile
+from .ai import EnemyAIStepper
+from .art import prebake_enemy_variants
+from .character_data import CharacterProfile
+from .constants import COMBO_DAMAGE_STEP, DIFFICULTY_PRESETS, SCREEN_HEIGHT, SCREEN_WIDTH, get_palette
+from .enemy_data import ENEMIES, STAGE_MODIFIERS
+from .entities import Enemy, Pickup, Player, SupportDrone
+from .fields import FieldEffects
+from .meta import ProgressState, apply_upgrades, upgrade_summary
+from .profiler import FrameProfiler
+from .projectiles import ProjectileField, enemy_boxes
+from .relic_data import RelicProfile, random_relic
+from .spatial import SpatialHash
+from .status import StatusEffects
+from .targeting import TargetIndex
+from .weapon import WeaponInstance
+from .weapon_data import WeaponProfile, random_weapon
+
+Point = Tuple[float, float]
+
+FIXED_DT = 1.0 / 60.0
+
+
+@dataclass
+class InputCommand:
+    """Player intent for one simulation tick."""
+
+    move: Point = (0.0, 0.0)
+    aim: Optional[Point] = None
+    fire: bool = False
+    interact: bool = False
+    ability: bool = False
+
+
+@dataclass
+class WaveState:
+    stage: int
+    wave: int
+    remaining_to_spawn: int
+    alive_enemies: int
+
+
+class Simulation:
+    def __init__(
+        self,
+        difficulty_profile: Optional[Mapping[str, float]] = None,
+        colors: Optional[Mapping[str, Tuple[int, int, int]]] = None,
+        bounds: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        profiler: Optional[FrameProfiler] = None,
+    ) -> None:
+        self.difficulty_profile = difficulty_profile or DIFFICULTY_PRESETS["normal"]
+        self.colors = colors or get_palette("deep_ocean")
+        self.bounds = pygame.Rect((0, 0), bounds)
+        self.profiler = profiler or FrameProfiler()
+
+        self.character: Optional[CharacterProfile] = None
+        self.player: Optional[Player] = None
+        self.projectiles = ProjectileField()
+        self.enemies = pygame.sprite.Group()
+        self.pickups = pygame.sprite.Group()
+        self.drones = pygame.sprite.Group()
+        self.enemy_index = SpatialHash()
+        self.pickup_index = SpatialHash()
+        self.enemy_ai = EnemyAIStepper()
+        self.status = StatusEffects()
+        self.targets = TargetIndex()
+        self.fields = FieldEffects()
+
+        self.wave_state: Optional[WaveState] = None
+        # Rolled by start_run; nothing touches the catalog before the first dive.
+        self.weapon_profile: Optional[WeaponProfile] = None
+        self.starting_weapon: Optional[WeaponProfile] = None
+        self.weapon_instance: Optional[WeaponInstance] = None
+        # Optional per-catalog weights for weapon drops (see analytics.drop_weights).
+        self.drop_weights: Optional[List[float]] = None
+        self.defeated = False
+        self.stage_timer = 0.0
+        self.kills = 0
+        self.total_damage_dealt = 0.0
+        self.total_damage_taken = 0.0
+        self.pickup_cooldown = 0.0
+        self.active_meta_levels: Optional[dict[str, int]] = None
+        self.combo_meter = 0
+        self.combo_level = 0
+        self.combo_timer = 0.0
+        self.ability_timer = 0.0
+        self.ability_cooldown_max = 0.0
+        self.ability_flash_timer = 0.0
+        self.ability_ready_notified = False
+        self.run_message = ""
+        self.run_message_timer = 0.0
+        self.relics: List[RelicProfile] = []
+        self.relic_effects: dict[str, float] = {}
+        self.dynamic_event_timer = 22.0
+        self.elapsed_time = 0.0
+        self.meta_drop_bonus = 0.0
+        self.meta_bonus_reward = 0.0
+        self.meta_starting_relics = 0
+        self.highest_combo = 0
+        self.ability_uses = 0
+        self.relics_bound_run = 0
+        self.weapons_synced_run = 0
+        self.drones_deployed_run = 0
+        self.reset_relic_effects()
+
+    def start(
+        self,
+        character: CharacterProfile,
+        progress: ProgressState,
+        weapon: Optional[WeaponProfile] = None,
+    ) -> None:
+        """Begin a fresh dive with ``character`` and its purchased upgrades.
+
+        ``weapon`` pins the starting weapon; by default one is rolled.
+        """
+
+        self.character = character
+        prebake_enemy_variants((profile.key, profile.tint) for profile in ENEMIES)
+        self.reset_relic_effects()
+        self.weapon_profile = weapon or random_weapon()
+        self.starting_weapon = self.weapon_profile
+        upgraded_stats = apply_upgrades(character, progress)
+        self.meta_drop_bonus = upgraded_stats.get("drop_bonus", 0.0)
+        self.meta_bonus_reward = upgraded_stats.get("bonus_credits", 0.0)
+        self.meta_starting_relics = int(upgraded_stats.get("starting_relics", 0))
+        self.weapon_instance = WeaponInstance(
+            self.weapon_profile,
+            upgraded_stats.get("damage", character.stats["damage"]),
+            upgraded_stats.get("focus", character.stats["focus"]),
+        )
+        self.player = Player(
+            character,
+            self.weapon_instance,
+            pygame.Vector2(self.bounds.center),
+            upgraded_stats=upgraded_stats,
+        )
+        self.projectiles.clear()
+        self.enemies = pygame.sprite.Group()
+        self.pickups = pygame.sprite.Group()
+        self.drones = pygame.sprite.Group()
+        self.enemy_index.clear()
+        self.pickup_index.clear()
+        self.status.clear()
+        self.targets.rebuild(())
+        self.wave_state = WaveState(stage=1, wave=1, remaining_to_spawn=0, alive_enemies=0)
+        self.defeated = False
+        self.stage_timer = 0.0
+        self.kills = 0
+        self.total_damage_dealt = 0.0
+        self.total_damage_taken = 0.0
+        self.pickup_cooldown = 0.0
+        self.combo_meter = 0
+        self.combo_level = 0
+        self.combo_timer = 0.0
+        self.ability_timer = 0.0
+        self.ability_cooldown_max = 0.0
+        self.ability_ready_notified = False
+        self.run_message = ""
+        self.run_message_timer = 0.0
+        self.fields.clear()
+        self.dynamic_event_timer = 18.0
+        self.elapsed_time = 0.0
+        self.active_meta_levels = upgrade_summary(character, progress)
+        self.highest_combo = 0
+        self.ability_uses = 0
+        self.relics_bound_run = 0
+        self.weapons_synced_run = 0
+        self.drones_deployed_run = 0
+        self.spawn_wave()
+        if self.meta_starting_relics > 0:
+            for _ in range(self.meta_starting_relics):
+                self.attune_relic(random_relic(exclude={r.key for r in self.relics}))
+        self.push_run_message("Dive initialized", 2.0)
+
+    def reset(self) -> None:
+        """Drop the current dive and every entity it spawned."""
+
+        self.player = None
+        self.projectiles.clear()
+        self.enemies.empty()
+        self.pickups.empty()
+        self.drones.empty()
+        self.enemy_index.clear()
+        self.pickup_index.clear()
+        self.status.clear()
+        self.targets.rebuild(())
+        self.wave_state = None
+        self.defeated = False
+        self.active_meta_levels = None
+        self.combo_meter = 0
+        self.combo_level = 0
+        self.combo_timer = 0.0
+        self.run_message = ""
+        self.run_message_timer = 0.0
+        self.reset_relic_effects()
+
+    def update_messages(self, dt: float) -> bool:
+        """Count down the run message; return True when it just expired."""
+
+        if self.run_message_timer > 0:
+            self.run_message_timer = max(0.0, self.run_message_timer - dt)
+            if self.run_message_timer == 0:
+                self.run_message = ""
+                return True
+        return False
+
+    def step(self, command: InputCommand, dt: float = FIXED_DT) -> None:
+        """Advance the dive by one tick of ``dt`` seconds."""
+
+        self.update_messages(dt)
+        if not self.player or self.defeated:
+            return
+        if command.ability:
+            self.try_activate_ability(command.aim)
+
+        self.elapsed_time += dt
+        ability_haste = 1.0 + self.relic_effects.get("ability_haste", 0.0)
+        self.ability_timer = max(0.0, self.ability_timer - dt * ability_haste)
+        if self.ability_timer == 0 and self.ability_cooldown_max > 0 and not self.ability_ready_notified:
+            self.push_run_message("Ability ready!", 1.4)
+            self.ability_ready_notified = True
+        self.profiler.lap("combo_events_fields")
+        self.update_combo(dt)
+        self.update_dynamic_events(dt)
+        self.fields.update(dt)
+        self.fields.resolve(self.enemy_index)
+
+        self.profiler.lap("player")
+        self.player.move(pygame.Vector2(command.move))
+        self.player.update(dt)
+        if self.weapon_instance:
+            self.weapon_instance.update(dt)
+
+        self.player.rect.clamp_ip(self.bounds.inflate(-80, -80))
+
+        self.profiler.lap("projectiles")
+        if command.fire and command.aim is not None and self.weapon_instance and self.weapon_instance.ready():
+            direction = pygame.Vector2(command.aim) - pygame.Vector2(self.player.rect.center)
+            if direction.length_squared() > 0:
+                self.weapon_instance.fire()
+                self.projectiles.spawn(
+                    self.player.rect.center,
+                    direction,
+                    speed=self.weapon_instance.profile.projectile_speed,
+                    damage=self.weapon_instance.damage,
+                    color=self.weapon_instance.profile.color,
+                )
+
+        self.projectiles.step(dt, self.bounds.inflate(120, 120))
+
+        self.profiler.lap("drones")
+        self.targets.rebuild(self.enemies.sprites())
+        drone_bonus = self.relic_effects.get("drone_damage", 0.0)
+        for drone in list(self.drones):
+            drone.update(dt, self.targets, self.projectiles, drone_bonus)
+
+        self.profiler.lap("enemy_ai")
+        player_pos = pygame.Vector2(self.player.rect.center)
+        active_enemies = self.enemies.sprites()
+        field_scale = self.fields.multipliers(active_enemies)
+        speed_scale = self.status.movement_scale(active_enemies, field_scale)
+        self.enemy_ai.step(active_enemies, self.player.rect.center, dt, speed_scale)
+        self.tick_status_effects(dt)
+        for enemy in active_enemies:
+            if not self.bounds.inflate(200, 200).colliderect(enemy.rect):
+                enemy.rect.clamp_ip(self.bounds.inflate(-120, -120))
+            if enemy.alive():
+                self.enemy_index.update(enemy)
+
+        self.profiler.lap("collisions")
+        for enemy in self.enemy_index.collide_rect(self.player.rect.inflate(-10, -10)):
+            damage = enemy.damage * dt * 0.6
+            if self.combo_level > 0:
+                damage *= max(0.2, 1.0 - self.relic_effects.get("combo_shield", 0.0))
+            self.player.take_damage(damage)
+            self.total_damage_taken += damage
+            if self.player.hp <= 0:
+                self.defeated = True
+                return
+
+        targets = self.enemies.sprites()
+        struck, totals = self.projectiles.collide(enemy_boxes(targets))
+        combo_multiplier = 1.0 + self.combo_level * COMBO_DAMAGE_STEP
+        for index, raw_damage in zip(struck.tolist(), totals.tolist()):
+            enemy = targets[index]
+            damage = raw_damage * combo_multiplier
+            enemy.take_damage(damage)
+            self.total_damage_dealt += damage
+            pull_strength = self.relic_effects.get("gravity_rounds", 0.0)
+            if pull_strength > 0 and self.player:
+                to_player = player_pos - pygame.Vector2(enemy.rect.center)
+                if to_player.length_squared() > 0:
+                    enemy.rect.centerx += int(to_player.x * 0.03 * pull_strength)
+                    enemy.rect.centery += int(to_player.y * 0.03 * pull_strength)
+                    self.enemy_index.update(enemy)
+            if enemy.hp <= 0:
+                self.handle_enemy_defeat(enemy)
+
+        self.profiler.lap("spawning")
+        if self.wave_state and self.wave_state.remaining_to_spawn > 0:
+            self.stage_timer += dt
+            if self.stage_timer >= 1.0:
+                self.stage_timer = 0.0
+                self.spawn_enemy_wave()
+
+        if self.wave_state and self.wave_state.remaining_to_spawn <= 0 and len(self.enemies) == 0:
+            self.advance_wave()
+
+        self.profiler.lap("pickups")
+        self.pickups.update(dt)
+        self.pickup_index.update_many(self.pickups)
+        self.pickup_cooldown = max(0.0, self.pickup_cooldown - dt)
+        if command.interact and self.pickup_cooldown == 0:
+            pickup = self.pickup_index.first_collision(self.player.rect)
+            if pickup:
+                pickup.kill()
+                self.pickup_index.remove(pickup)
+                if pickup.pickup_type == "weapon":
+                    self.equip_weapon(pickup.payload)
+                    if self.relic_effects.get("pickup_speed", 0.0) > 0:
+                        self.player.reset_pickup_speed(
+                            self.relic_effects["pickup_speed"],
+                            8.0,
+                        )
+                elif pickup.pickup_type == "relic":
+                    self.attune_relic(pickup.payload)
+                self.pickup_cooldown = 0.4
+
+    def reward(self) -> int:
+        """Aether credits earned by the dive so far."""
+
+        reward = int(
+            self.kills * 3
+            + (self.wave_state.stage if self.wave_state else 0) * 40
+            + self.total_damage_dealt * 0.02
+        )
+        reward = max(25, reward)
+        reward += int(self.meta_bonus_reward)
+        reward += int(self.relic_effects.get("bonus_credits", 0.0))
+        return int(reward * self.difficulty_profile.get("reward", 1.0))
+
+    def run_stats(self, reward: int) -> Dict[str, float]:
+        return {
+            "kills": self.kills,
+            "damage_dealt": self.total_damage_dealt,
+            "damage_taken": self.total_damage_taken,
+            "relics": self.relics_bound_run,
+            "weapons": self.weapons_synced_run,
+            "combo": self.highest_combo,
+            "duration": self.elapsed_time,
+            "stage": self.wave_state.stage if self.wave_state else 0,
+            "credits": reward,
+            "ability_uses": self.ability_uses,
+        }
+
+    def spawn_wave(self) -> None:
+        if not self.wave_state:
+            return
+        stage = self.wave_state.stage
+        base_count = 5 + stage * 2
+        spawn_rate = self.difficulty_profile.get("spawn_rate", 1.0)
+        enemy_count = max(3, int(round(base_count * spawn_rate)))
+        self.wave_state.remaining_to_spawn = enemy_count
+        self.wave_state.alive_enemies = enemy_count
+        self.stage_timer = 0.0
+        for _ in range(min(4, enemy_count)):
+            self.spawn_enemy_wave()
+
+    def spawn_enemy_wave(self) -> None:
+        if not self.wave_state or self.wave_state.remaining_to_spawn <= 0:
+            return
+        profile = random.choice(ENEMIES)
+        modifier = STAGE_MODIFIERS.get(self.wave_state.stage, STAGE_MODIFIERS[max(STAGE_MODIFIERS)])
+        position = pygame.Vector2(
+            random.randint(140, self.bounds.width - 140),
+            random.randint(140, self.bounds.height - 140),
+        )
+        diff = self.difficulty_profile
+        hp_mod = modifier["hp"] * diff.get("enemy_hp", 1.0)
+        speed_mod = modifier["speed"] * diff.get("enemy_speed", 1.0)
+        damage_mod = modifier["damage"] * diff.get("enemy_damage", 1.0)
+        enemy = Enemy(profile, hp_mod, position)
+        enemy.speed = profile.speed * speed_mod
+        enemy.damage = profile.damage * damage_mod
+        self.enemies.add(enemy)
+        self.enemy_index.insert(enemy)
+        self.wave_state.remaining_to_spawn -= 1
+
+    def spawn_pickup(self, position) -> None:
+        exclude = {self.weapon_instance.profile.name} if self.weapon_instance else set()
+        weapon_profile = random_weapon(exclude=exclude, weights=self.drop_weights)
+        pickup = Pickup("weapon", weapon_profile, pygame.Vector2(position), self.colors["loot"])
+        self.pickups.add(pickup)
+        self.pickup_index.insert(pickup)
+
+    def spawn_relic(self, position) -> None:
+        relic = random_relic(exclude={r.key for r in self.relics})
+        pickup = Pickup("relic", relic, pygame.Vector2(position), self.colors["relic"])
+        self.pickups.add(pickup)
+        self.pickup_index.insert(pickup)
+
+    def advance_wave(self) -> None:
+        if not self.wave_state:
+            return
+        self.wave_state.wave += 1
+        if self.wave_state.wave > 3:
+            self.wave_state.stage += 1
+            self.wave_state.wave = 1
+        heal_ratio = 0.2 + self.relic_effects.get("wave_heal", 0.0)
+        self.player.heal(self.player.max_hp * heal_ratio)
+        self.push_run_message(f"Wave cleared! Integrity +{int(heal_ratio * 100)}%", 1.4)
+        self.spawn_wave()
+
+    def equip_weapon(self, profile: WeaponProfile) -> None:
+        if not self.player:
+            return
+        self.weapon_profile = profile
+        self.weapon_instance = WeaponInstance(profile, self.player.damage_multiplier, self.player.focus_multiplier)
+        self.player.weapon = self.weapon_instance
+        self.player.refresh_stats()
+        self.push_run_message(f"Attuned {profile.name}", 1.2)
+        self.weapons_synced_run += 1
+
+    def push_run_message(self, text: str, duration: float = 1.6) -> None:
+        self.run_message = text
+        self.run_message_timer = duration
+
+    def update_combo(self, dt: float) -> None:
+        if self.combo_timer > 0:
+            self.combo_timer = max(0.0, self.combo_timer - dt)
+            if self.combo_timer == 0:
+                self.combo_meter = 0
+                self.combo_level = 0
+        shield_ratio = self.relic_effects.get("combo_shield", 0.0)
+        if self.combo_level > 0 and shield_ratio > 0 and self.player:
+            desired = self.player.max_hp * shield_ratio
+            if self.player.shield < desired:
+                self.player.grant_shield(desired - self.player.shield)
+
+    def update_dynamic_events(self, dt: float) -> None:
+        rate = 1.0 + self.relic_effects.get("event_rate", 0.0)
+        self.dynamic_event_timer -= dt * rate
+        if self.dynamic_event_timer <= 0:
+            self.trigger_dynamic_event()
+            self.dynamic_event_timer = random.uniform(24.0, 38.0)
+
+    def trigger_dynamic_event(self) -> None:
+        if not self.player:
+            return
+        arena = self.bounds.inflate(-240, -240)
+        event = random.choices(
+            ["supply_drop", "relic_cache", "heal_field", "stasis"],
+            weights=[4, 2, 3, 2],
+        )[0]
+        if event == "supply_drop":
+            for _ in range(2):
+                position = (
+                    random.randint(arena.left, arena.right),
+                    random.randint(arena.top, arena.bottom),
+                )
+                self.spawn_pickup(position)
+            self.push_run_message("Supply drop located!", 2.0)
+        elif event == "relic_cache":
+            position = (
+                random.randint(arena.left, arena.right),
+                random.randint(arena.top, arena.bottom),
+            )
+            self.spawn_relic(position)
+            self.push_run_message("Relic cache detected!", 2.0)
+        elif event == "heal_field":
+            self.player.heal(self.player.max_hp * 0.18)
+            self.push_run_message("Restorative surge released!", 2.0)
+        elif event == "stasis":
+            self.fields.add(pygame.Vector2(self.player.rect.center), 260.0, 0.45, 6.0, source="stasis")
+            self.push_run_message("Temporal field deployed.", 2.0)
+
+    def tick_status_effects(self, dt: float) -> None:
+        burn_scale = 1.0 + self.relic_effects.get("burn_bonus", 0.0)
+        damage = self.status.advance(dt, {"burn": burn_scale})
+        for enemy, amount in damage.items():
+            if not enemy.alive():
+                continue
+            enemy.take_damage(amount)
+            self.total_damage_dealt += amount
+            if enemy.hp <= 0:
+                self.handle_enemy_defeat(enemy)
+        for enemy in self.status.drain_changed():
+            if enemy.alive():
+                enemy.set_status_overlay(self.status.overlay(enemy))
+
+    def handle_enemy_defeat(self, enemy: Enemy) -> None:
+        enemy.kill()
+        self.enemy_index.remove(enemy)
+        self.status.remove_target(enemy)
+        self.kills += 1
+        if self.wave_state:
+            self.wave_state.alive_enemies -= 1
+        self.combo_meter += 1
+        self.highest_combo = max(self.highest_combo, self.combo_meter)
+        self.combo_timer = 5.0 + self.relic_effects.get("combo_extend", 0.0)
+        new_level = max(self.combo_level, self.combo_meter // 10)
+        if new_level > self.combo_level:
+            self.combo_level = new_level
+            self.push_run_message(f"Combo Tier {self.combo_level}!", 1.2)
+        drop_chance = min(0.9, 0.25 + 0.05 * self.combo_level + self.meta_drop_bonus)
+        if random.random() < drop_chance:
+            self.spawn_pickup(enemy.rect.center)
+        relic_chance = min(0.45, 0.1 + 0.03 * self.combo_level)
+        if random.random() < relic_chance:
+            self.spawn_relic(enemy.rect.center)
+        if self.relic_effects.get("combo_drop", 0.0) > 0 and self.combo_level and self.combo_level % 5 == 0:
+            self.spawn_pickup(enemy.rect.center)
+
+    def try_activate_ability(self, aim: Optional[Point] = None) -> None:
+        if not self.player or not self.character:
+            return
+        if self.ability_timer > 0:
+            self.push_run_message("Ability recharging...", 0.8)
+            return
+        ability = ABILITIES[self.character.ability_key]
+        self.ability_uses += 1
+        self.execute_ability(ability, aim)
+        combo_reduction = min(0.45, 0.05 * self.combo_level)
+        cooldown = max(ability.cooldown * 0.4, ability.cooldown * (1.0 - combo_reduction))
+        self.ability_timer = cooldown
+        self.ability_cooldown_max = cooldown
+        self.ability_ready_notified = False
+        if self.relic_effects.get("ability_shield", 0.0) > 0:
+            self.player.grant_shield(self.relic_effects["ability_shield"])
+        self.ability_flash_timer = 0.5
+
+    def execute_ability(self, ability: AbilityProfile, aim: Optional[Point] = None) -> None:
+        if not self.player:
+            return
+        self.push_run_message(f"{ability.name}!", 1.2)
+        center = pygame.Vector2(self.player.rect.center)
+        if ability.effect == "blink":
+            direction = pygame.Vector2(aim) - center if aim is not None else pygame.Vector2()
+            if direction.length_squared() > 0:
+                offset = direction.normalize() * ability.magnitude
+                new_pos = center + offset
+                bounds = self.bounds.inflate(-120, -120)
+                new_pos.x = max(bounds.left, min(bounds.right, new_pos.x))
+                new_pos.y = max(bounds.top, min(bounds.bottom, new_pos.y))
+                self.player.rect.center = (int(new_pos.x), int(new_pos.y))
+            self.player.invincible_timer = ability.payload.get("invuln", 0.5)
+        elif ability.effect == "overdrive":
+            duration = ability.payload.get("duration", 5.0)
+            self.player.apply_temp_bonus(
+                damage=ability.magnitude,
+                focus=ability.payload.get("focus", 0.0),
+                speed=ability.payload.get("speed", 0.0),
+                crit=ability.payload.get("crit", 0.0),
+                duration=duration,
+            )
+            if ability.payload.get("shield"):
+                self.player.grant_shield(ability.payload["shield"])
+        elif ability.effect == "nova":
+            count = int(ability.payload.get("projectiles", 12))
+            damage = (self.weapon_instance.damage if self.weapon_instance else 14.0) * ability.magnitude
+            speed = self.weapon_instance.profile.projectile_speed if self.weapon_instance else 520
+            self.projectiles.spawn_ring(
+                center,
+                count,
+                speed,
+                damage,
+                self.weapon_instance.profile.color if self.weapon_instance else self.colors["loot"],
+            )
+            ignite_duration = ability.payload.get("ignite", 0.0)
+            if ignite_duration > 0:
+                for enemy in self.enemies:
+                    self.status.apply("burn", enemy, ignite_duration, 12.0 * ability.magnitude)
+        elif ability.effect == "summon_drone":
+            drone = SupportDrone(
+                self.player,
+                orbit_radius=120.0,
+                damage=ability.magnitude,
+                fire_delay=ability.payload.get("fire_delay", 1.0),
+                duration=ability.payload.get("duration", 14.0),
+            )
+            self.drones.add(drone)
+            self.drones_deployed_run += 1
+        elif ability.effect == "summon_drone_squad":
+            count = int(ability.payload.get("count", 3))
+            for _ in range(count):
+                drone = SupportDrone(
+                    self.player,
+                    orbit_radius=random.uniform(110.0, 150.0),
+                    damage=ability.magnitude,
+                    fire_delay=ability.payload.get("fire_delay", 1.2),
+                    duration=ability.payload.get("duration", 16.0),
+                )
+                self.drones.add(drone)
+            self.drones_deployed_run += count
+        elif ability.effect == "gravity":
+            self.fields.add(
+                pygame.Vector2(self.player.rect.center),
+                ability.magnitude,
+                ability.payload.get("slow", 0.35),
+                ability.payload.get("duration", 5.0),
+            )
+        elif ability.effect == "shockwave":
+            boost = 1.0 + self.relic_effects.get("shockwave_boost", 0.0)
+            for enemy in list(self.enemies):
+                delta = pygame.Vector2(enemy.rect.center) - center
+                if delta.length_squared() == 0:
+                    continue
+                knock = delta.normalize() * ability.magnitude * boost
+                enemy.rect.centerx += int(knock.x)
+                enemy.rect.centery += int(knock.y)
+                self.enemy_index.update(enemy)
+                enemy.take_damage((self.weapon_instance.damage if self.weapon_instance else 10.0) * ability.payload.get("damage", 1.0))
+                stun = ability.payload.get("stun", 1.0)
+                self.status.apply("stun", enemy, stun)
+                self.status.apply("slow", enemy, stun, 0.2)
+                if enemy.hp <= 0:
+                    self.handle_enemy_defeat(enemy)
+        elif ability.effect == "heal_shield":
+            self.player.heal(self.player.max_hp * ability.magnitude)
+            self.player.grant_shield(ability.payload.get("shield", self.player.max_hp * 0.2))
+        elif ability.effect == "storm":
+            chains = int(ability.payload.get("chains", 4))
+            slow_factor = max(0.2, 1.0 - ability.payload.get("slow", 0.3))
+            for enemy in self.targets.nearest(center, chains):
+                enemy.take_damage((self.weapon_instance.damage if self.weapon_instance else 16.0) * ability.magnitude)
+                self.status.apply("slow", enemy, 2.4, slow_factor)
+                if enemy.hp <= 0:
+                    self.handle_enemy_defeat(enemy)
+
+    def attune_relic(self, relic: RelicProfile) -> None:
+        if not self.player:
+            return
+        self.relics.append(relic)
+        self.relics_bound_run += 1
+        self.apply_relic_effect(relic)
+        self.push_run_message(f"Bound relic: {relic.name}", 2.0)
+
+    def apply_relic_effect(self, relic: RelicProfile) -> None:
+        effect = relic.effect
+        if effect == "damage_bonus":
+            self.relic_effects["damage_bonus"] += relic.value
+            self.player.apply_permanent_bonus("damage", relic.value)
+        elif effect == "ability_haste":
+            self.relic_effects["ability_haste"] += relic.value
+        elif effect == "combo_extend":
+            self.relic_effects["combo_extend"] += relic.value
+        elif effect == "combo_shield":
+            self.relic_effects["combo_shield"] += relic.value
+        elif effect == "wave_heal":
+            self.relic_effects["wave_heal"] += relic.value
+        elif effect == "focus_bonus":
+            self.relic_effects["focus_bonus"] += relic.value
+            self.player.apply_permanent_bonus("focus", 0.05)
+        elif effect == "gravity_rounds":
+            self.relic_effects["gravity_rounds"] += relic.value
+        elif effect == "ability_shield":
+            self.relic_effects["ability_shield"] += relic.value
+        elif effect == "pickup_speed":
+            self.relic_effects["pickup_speed"] = max(self.relic_effects.get("pickup_speed", 0.0), relic.value)
+        elif effect == "drone_damage":
+            self.relic_effects["drone_damage"] += relic.value
+        elif effect == "event_rate":
+            self.relic_effects["event_rate"] += relic.value
+        elif effect == "crit_bonus":
+            self.player.apply_permanent_bonus("crit", relic.value)
+        elif effect == "shockwave_boost":
+            self.relic_effects["shockwave_boost"] += relic.value
+        elif effect == "burn_bonus":
+            self.relic_effects["burn_bonus"] += relic.value
+        elif effect == "max_hp":
+            self.player.apply_permanent_bonus("max_hp", relic.value)
+        elif effect == "bonus_credits":
+            self.relic_effects["bonus_credits"] += relic.value
+        elif effect == "combo_drop":
+            self.relic_effects["combo_drop"] += relic.value
+        self.player.refresh_stats()
+
+    def reset_relic_effects(self) -> None:
+        self.relics = []
+        self.relic_effects = {
+            "damage_bonus": 0.0,
+            "ability_haste": 0.0,
+            "combo_extend": 0.0,
+            "combo_shield": 0.0,
+            "wave_heal": 0.0,
+            "focus_bonus": 0.0,
+            "gravity_rounds": 0.0,
+            "ability_shield": 0.0,
+            "pickup_speed": 0.0,
+            "drone_damage": 0.0,
+            "event_rate": 0.0,
+            "crit_bonus": 0.0,
+            "shockwave_boost": 0.0,
+            "burn_bonus": 0.0,
+            "bonus_credits": 0.0,
+            "combo_drop": 0.0,
+        }
+        self.fields.clear()
+
+
+class Autopilot:
+    """Scripted pilot that turns simulation state into input commands.
+
+    It leads its shots at the nearest enemy and fires continuously. With a
+    ``kite_radius`` it backs away from enemies that close in, drifting back
+    toward the arena center. It can fire the signature ability whenever it
+    is ready and bind relics it walks over. Weapon pickups are left alone so
+    a run keeps the weapon it started with.
+    """
+
+    def __init__(self, kite_radius: float = 0.0, use_ability: bool = False, collect_relics: bool = False) -> None:
+        self.kite_radius = kite_radius
+        self.use_ability = use_ability
+        self.collect_relics = collect_relics
+        self._last_seen: Dict[object, pygame.Vector2] = {}
+
+    def command(self, sim: Simulation) -> InputCommand:
+        if not sim.player:
+            return InputCommand()
+        origin = pygame.Vector2(sim.player.rect.center)
+        nearest = sim.targets.nearest(sim.player.rect.center)
+        aim = None
+        move = pygame.Vector2()
+        if nearest and sim.weapon_instance:
+            enemy = nearest[0]
+            aim = self._lead(origin, enemy, sim.weapon_instance.profile.projectile_speed)
+            away = origin - pygame.Vector2(enemy.rect.center)
+            if self.kite_radius and 0 < away.length() < self.kite_radius:
+                move = away.normalize() + (pygame.Vector2(sim.bounds.center) - origin) / max(1, sim.bounds.width)
+        interact = False
+        if self.collect_relics:
+            pickup = sim.pickup_index.first_collision(sim.player.rect)
+            interact = pickup is not None and pickup.pickup_type == "relic"
+        return InputCommand(
+            move=(move.x, move.y),
+            aim=aim,
+            fire=aim is not None,
+            interact=interact,
+            ability=self.use_ability and sim.ability_timer == 0 and aim is not None,
+        )
+
+    def _lead(self, origin: pygame.Vector2, enemy: Enemy, projectile_speed: float) -> Point:
+        """Aim where ``enemy`` will be when a shot arrives, so orbiters get hit."""
+
+        position = pygame.Vector2(enemy.rect.center)
+        previous = self._last_seen.get(enemy)
+        self._last_seen = {enemy: position}
+        if previous is None:
+            return position.x, position.y
+        velocity = (position - previous) / FIXED_DT
+        target = position + velocity * (origin.distance_to(position) / max(1.0, projectile_speed))
+        return target.x, target.y
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+"""Uniform-grid spatial hash used for broad-phase collision queries.
+
+Sprites register their ``rect`` into every grid cell it overlaps and only
+re-bucket when that cell span changes, so moving within a cell is nearly
+free. Queries touch the cells around the probe instead of every sprite in a
+group, which keeps collision cost proportional to local density.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import pygame
+
+from .constants import SPATIAL_CELL_SIZE
+
+Cell = Tuple[int, int]
+Span = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = max(1, int(cell_size))
+        # Buckets are insertion-ordered dicts so query order is deterministic.
+        self._cells: Dict[Cell, Dict[pygame.sprite.Sprite, None]] = {}
+        self._spans: Dict[pygame.sprite.Sprite, Span] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._spans
+
+    def _span(self, rect: pygame.Rect) -> Span:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def insert(self, item: pygame.sprite.Sprite) -> None:
+        self.update(item)
+
+    def update(self, item: pygame.sprite.Sprite) -> None:
+        """Register ``item`` or re-bucket it if its rect moved to new cells."""
+
+        span = self._span(item.rect)
+        previous = self._spans.get(item)
+        if previous == span:
+            return
+        if previous is not None:
+            self._unlink(item, previous)
+        self._spans[item] = span
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {item: None}
+                else:
+                    bucket[item] = None
+
+    def update_many(self, items: Iterable[pygame.sprite.Sprite]) -> None:
+        for item in items:
+            self.update(item)
+
+    def remove(self, item: pygame.sprite.Sprite) -> None:
+        span = self._spans.pop(item, None)
+        if span is not None:
+            self._unlink(item, span)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._spans.clear()
+
+    def prune(self) -> None:
+        """Drop sprites that were killed without being removed."""
+
+        for item in [item for item in self._spans if not item.alive()]:
+            self.remove(item)
+
+    def _unlink(self, item: pygame.sprite.Sprite, span: Span) -> None:
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.pop(item, None)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def query_rect(self, rect: pygame.Rect) -> Dict[pygame.sprite.Sprite, None]:
+        """Return broad-phase candidates whose cells overlap ``rect``."""
+
+        found: Dict[pygame.sprite.Sprite, None] = {}
+        cells = self._cells
+        x0, y0, x1, y1 = self._span(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def collide_rect(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Return live sprites whose rect overlaps ``rect``."""
+
+        return [item for item in self.query_rect(rect) if item.alive() and rect.colliderect(item.rect)]
+
+    def first_collision(self, rect: pygame.Rect) -> Optional[pygame.sprite.Sprite]:
+        for item in self.query_rect(rect):
+            if item.alive() and rect.colliderect(item.rect):
+                return item
+        return None
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> List[pygame.sprite.Sprite]:
+        """Return live sprites whose center lies within ``radius`` of ``center``."""
+
+        cx, cy = center
+        box = pygame.Rect(int(cx - radius), int(cy - radius), int(radius * 2) + 1, int(radius * 2) + 1)
+        limit = radius * radius
+        found: List[pygame.sprite.Sprite] = []
+        for item in self.query_rect(box):
+            if not item.alive():
+                continue
+            ix, iy = item.rect.center
+            dx = ix - cx
+            dy = iy - cy
+            if dx * dx + dy * dy <= limit:
+                found.append(item)
+        return found
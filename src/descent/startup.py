@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""Startup timing for ``python -m descent --startup-trace``.
+
+:class:`StartupTrace` records named phases (argument parsing, module
+imports, subsystem init, the first presented frame, idle warm-up tasks) and,
+while :meth:`StartupTrace.watch_imports` is active, the cumulative import
+time of each ``descent`` module and of the heavyweight third-party packages.
+The report is printed to stderr once the main menu has been on screen and the
+warm-up queue has drained.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+# Top-level third-party packages worth reporting on their own.
+TRACKED_PACKAGES = ("numpy", "pygame", "sqlite3")
+
+
+class _TimedLoader:
+    def __init__(self, loader, trace: "StartupTrace", name: str) -> None:
+        self._loader = loader
+        self._trace = trace
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._loader, attribute)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._trace.imports[self._name] = (time.perf_counter() - started) * 1000.0
+
+
+class _ImportTimer:
+    """Wraps the loaders of tracked modules to time their execution."""
+
+    def __init__(self, trace: "StartupTrace") -> None:
+        self._trace = trace
+        self._busy = False
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if self._busy or not (fullname in TRACKED_PACKAGES or fullname.startswith("descent.")):
+            return None
+        self._busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._busy = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._trace, fullname)
+        return spec
+
+
+class StartupTrace:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: Dict[str, float] = {}
+        self.reported = False
+        self._finder: Optional[_ImportTimer] = None
+
+    def watch_imports(self) -> None:
+        if self.enabled and self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def stop_watching(self) -> None:
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - started) * 1000.0))
+
+    def mark(self, name: str) -> None:
+        """Record ``name`` at the time elapsed since the trace began."""
+
+        if self.enabled:
+            self.phases.append((f"@ {name}", (time.perf_counter() - self.origin) * 1000.0))
+
+    def report(self, stream: Optional[TextIO] = None, top: int = 20) -> None:
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        self.stop_watching()
+        stream = stream or sys.stderr
+        print("startup trace (ms)", file=stream)
+        for name, elapsed in self.phases:
+            print(f"  {name:<32} {elapsed:9.2f}", file=stream)
+        if self.imports:
+            print(f"imports, cumulative (top {top})", file=stream)
+            for name, elapsed in sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]:
+                print(f"  {name:<32} {elapsed:9.2f}", file=stream)
+
+
+STARTUP_TRACE = StartupTrace()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+"""Status-effect component store for enemies.
+
+Each effect (burn, poison, slow, stun, chain) owns an :class:`EffectTrack`
+that keeps only the targets currently affected, packed into arrays with
+swap-remove. Expiry is driven by a per-track min-heap of expiry times, so
+ticking the store never scans enemies that carry no effect.
+"""
+
+import heapq
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Element keywords from weapon_data.ELEMENTS map onto these effects.
+STATUS_EFFECTS: Tuple[str, ...] = ("burn", "poison", "slow", "stun", "chain")
+DAMAGE_OVER_TIME: Tuple[str, ...] = ("burn", "poison")
+
+# Enemy sprite overlay shown for each effect, highest priority first.
+OVERLAY_PRIORITY: Tuple[Tuple[str, str], ...] = (
+    ("stun", "stun"),
+    ("burn", "ignite"),
+    ("slow", "slow"),
+)
+
+DEFAULT_MAGNITUDES: Dict[str, float] = {"slow": 0.6}
+MIN_SPEED_SCALE = 0.1
+
+
+class EffectTrack:
+    """Active instances of one effect, packed for vectorized ticking."""
+
+    def __init__(self, name: str, capacity: int = 32) -> None:
+        self.name = name
+        self.targets: List[Hashable] = []
+        self.slots: Dict[Hashable, int] = {}
+        self.magnitude = np.zeros(capacity, dtype=np.float64)
+        self.expires = np.zeros(capacity, dtype=np.float64)
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def __contains__(self, target: Hashable) -> bool:
+        return target in self.slots
+
+    def apply(self, target: Hashable, expires_at: float, magnitude: float) -> None:
+        """Add ``target`` or refresh its expiry and magnitude."""
+
+        slot = self.slots.get(target)
+        if slot is None:
+            slot = len(self.targets)
+            if slot >= len(self.magnitude):
+                self.magnitude = np.resize(self.magnitude, slot * 2)
+                self.expires = np.resize(self.expires, slot * 2)
+            self.targets.append(target)
+            self.slots[target] = slot
+        self.magnitude[slot] = magnitude
+        self.expires[slot] = expires_at
+        self._sequence += 1
+        heapq.heappush(self._heap, (expires_at, self._sequence, target))
+
+    def remove(self, target: Hashable) -> bool:
+        slot = self.slots.pop(target, None)
+        if slot is None:
+            return False
+        last = len(self.targets) - 1
+        if slot != last:
+            moved = self.targets[last]
+            self.targets[slot] = moved
+            self.slots[moved] = slot
+            self.magnitude[slot] = self.magnitude[last]
+            self.expires[slot] = self.expires[last]
+        self.targets.pop()
+        return True
+
+    def expire(self, now: float) -> List[Hashable]:
+        """Remove and return targets whose effect ended at or before ``now``."""
+
+        expired: List[Hashable] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, target = heapq.heappop(heap)
+            slot = self.slots.get(target)
+            # Stale heap entries belong to refreshed or removed effects.
+            if slot is None or self.expires[slot] != expires_at:
+                continue
+            self.remove(target)
+            expired.append(target)
+        if not self.targets:
+            heap.clear()
+        return expired
+
+    def magnitude_of(self, target: Hashable, default: float = 0.0) -> float:
+        slot = self.slots.get(target)
+        return default if slot is None else float(self.magnitude[slot])
+
+    def expires_at(self, target: Hashable) -> Optional[float]:
+        slot = self.slots.get(target)
+        return None if slot is None else float(self.expires[slot])
+
+    def clear(self) -> None:
+        self.targets.clear()
+        self.slots.clear()
+        self._heap.clear()
+
+
+class StatusEffects:
+    def __init__(self, effects: Sequence[str] = STATUS_EFFECTS) -> None:
+        self.clock = 0.0
+        self.tracks: Dict[str, EffectTrack] = {name: EffectTrack(name) for name in effects}
+        self._changed: Set[Hashable] = set()
+
+    def apply(
+        self,
+        effect: str,
+        target: Hashable,
+        duration: float,
+        magnitude: Optional[float] = None,
+    ) -> None:
+        if duration <= 0:
+            return
+        if magnitude is None:
+            magnitude = DEFAULT_MAGNITUDES.get(effect, 0.0)
+        track = self.tracks[effect]
+        if target not in track:
+            self._changed.add(target)
+        track.apply(target, self.clock + duration, magnitude)
+
+    def has(self, effect: str, target: Hashable) -> bool:
+        return target in self.tracks[effect]
+
+    def magnitude(self, effect: str, target: Hashable, default: float = 0.0) -> float:
+        return self.tracks[effect].magnitude_of(target, default)
+
+    def remaining(self, effect: str, target: Hashable) -> float:
+        expires_at = self.tracks[effect].expires_at(target)
+        return 0.0 if expires_at is None else max(0.0, expires_at - self.clock)
+
+    def remove_target(self, target: Hashable) -> None:
+        for track in self.tracks.values():
+            track.remove(target)
+        self._changed.discard(target)
+
+    def clear(self) -> None:
+        self.clock = 0.0
+        for track in self.tracks.values():
+            track.clear()
+        self._changed.clear()
+
+    def advance(
+        self,
+        dt: float,
+        damage_scale: Optional[Dict[str, float]] = None,
+    ) -> Dict[Hashable, float]:
+        """Tick damage-over-time effects, expire finished ones.
+
+        Returns the damage each affected target takes this tick.
+        """
+
+        damage: Dict[Hashable, float] = {}
+        for name in DAMAGE_OVER_TIME:
+            track = self.tracks.get(name)
+            if track is None or not len(track):
+                continue
+            scale = (damage_scale or {}).get(name, 1.0)
+            ticks = track.magnitude[: len(track)] * (dt * scale)
+            for target, amount in zip(track.targets, ticks.tolist()):
+                damage[target] = damage.get(target, 0.0) + amount
+        self.clock += dt
+        for track in self.tracks.values():
+            self._changed.update(track.expire(self.clock))
+        return damage
+
+    def movement_scale(
+        self,
+        targets: Sequence[Hashable],
+        base: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return per-target speed multipliers with slow and stun applied."""
+
+        scale = np.ones(len(targets), dtype=np.float64) if base is None else np.array(base, dtype=np.float64)
+        slow = self.tracks.get("slow")
+        stun = self.tracks.get("stun")
+        if (slow is None or not len(slow)) and (stun is None or not len(stun)):
+            return np.maximum(scale, MIN_SPEED_SCALE)
+        positions = {target: index for index, target in enumerate(targets)}
+        if slow is not None:
+            for target, factor in zip(slow.targets, slow.magnitude[: len(slow)].tolist()):
+                index = positions.get(target)
+                if index is not None:
+                    scale[index] *= factor
+        scale = np.maximum(scale, MIN_SPEED_SCALE)
+        if stun is not None:
+            for target in stun.targets:
+                index = positions.get(target)
+                if index is not None:
+                    scale[index] = 0.0
+        return scale
+
+    def overlay(self, target: Hashable) -> Optional[str]:
+        for effect, overlay in OVERLAY_PRIORITY:
+            track = self.tracks.get(effect)
+            if track is not None and target in track:
+                return overlay
+        return None
+
+    def drain_changed(self) -> Iterable[Hashable]:
+        """Return and reset the targets whose set of effects changed."""
+
+        changed = self._changed
+        self._changed = set()
+        return changed
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+"""Shared nearest-target queries for drones, chain effects and homing shots.
+
+:class:`TargetIndex` snapshots live targets into a uniform grid once per
+frame. A k-nearest query walks rings of cells outward from the probe until
+no unvisited cell can hold a closer target, then partial-selects the ``k``
+closest candidates with ``argpartition`` instead of sorting everything.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from .constants import SPATIAL_CELL_SIZE
+
+TARGET_CELL_SIZE = SPATIAL_CELL_SIZE * 2
+
+Cell = Tuple[int, int]
+
+
+class TargetIndex:
+    def __init__(self, cell_size: int = TARGET_CELL_SIZE) -> None:
+        self.cell_size = max(1, int(cell_size))
+        self.targets: List[pygame.sprite.Sprite] = []
+        self.positions = np.zeros((0, 2), dtype=np.float64)
+        self._cells: Dict[Cell, np.ndarray] = {}
+        self._bounds: Tuple[int, int, int, int] = (0, 0, -1, -1)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def rebuild(self, targets: Sequence[pygame.sprite.Sprite]) -> None:
+        self.targets = list(targets)
+        self._cells = {}
+        if not self.targets:
+            self.positions = np.zeros((0, 2), dtype=np.float64)
+            self._bounds = (0, 0, -1, -1)
+            return
+        self.positions = np.array([target.rect.center for target in self.targets], dtype=np.float64)
+        cells = np.floor(self.positions / self.cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        sorted_cells = cells[order]
+        breaks = np.flatnonzero(np.any(np.diff(sorted_cells, axis=0) != 0, axis=1)) + 1
+        for members, cell in zip(np.split(order, breaks), sorted_cells[np.r_[0, breaks]].tolist()):
+            self._cells[(cell[0], cell[1])] = members
+        low = cells.min(axis=0).tolist()
+        high = cells.max(axis=0).tolist()
+        self._bounds = (low[0], low[1], high[0], high[1])
+
+    def nearest(
+        self,
+        point: Tuple[float, float],
+        k: int = 1,
+        max_radius: Optional[float] = None,
+        predicate: Optional[Callable[[pygame.sprite.Sprite], bool]] = None,
+    ) -> List[pygame.sprite.Sprite]:
+        """Return up to ``k`` targets ordered by distance from ``point``.
+
+        Targets that died since :meth:`rebuild` are skipped, as are targets
+        rejected by ``predicate``.
+        """
+
+        if k <= 0 or not self.targets:
+            return []
+        px, py = float(point[0]), float(point[1])
+        size = self.cell_size
+        ox, oy = int(px // size), int(py // size)
+        low_x, low_y, high_x, high_y = self._bounds
+        max_ring = max(ox - low_x, high_x - ox, oy - low_y, high_y - oy, 0)
+        if max_radius is not None:
+            max_ring = min(max_ring, int(max_radius // size) + 1)
+
+        found: List[np.ndarray] = []
+        count = 0
+        best: Optional[np.ndarray] = None
+        for ring in range(max_ring + 1):
+            members = self._ring_members(ox, oy, ring)
+            if members:
+                batch = self._filter(np.concatenate(members), predicate)
+                if len(batch):
+                    found.append(batch)
+                    count += len(batch)
+            if count >= k:
+                candidates = np.concatenate(found)
+                distances = self._distances(candidates, px, py)
+                kth = np.partition(distances, k - 1)[k - 1]
+                # Every cell beyond this ring is at least ``ring * size`` away.
+                if kth <= (ring * size) ** 2:
+                    best = candidates
+                    break
+        if best is None:
+            if not found:
+                return []
+            best = np.concatenate(found)
+        distances = self._distances(best, px, py)
+        if max_radius is not None:
+            within = distances <= max_radius * max_radius
+            best = best[within]
+            distances = distances[within]
+        if len(best) > k:
+            keep = np.argpartition(distances, k - 1)[:k]
+            best = best[keep]
+            distances = distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return [self.targets[index] for index in best[order].tolist()]
+
+    def _ring_members(self, ox: int, oy: int, ring: int) -> List[np.ndarray]:
+        cells = self._cells
+        if ring == 0:
+            members = cells.get((ox, oy))
+            return [] if members is None else [members]
+        found: List[np.ndarray] = []
+        for cx in range(ox - ring, ox + ring + 1):
+            for cy in (oy - ring, oy + ring):
+                members = cells.get((cx, cy))
+                if members is not None:
+                    found.append(members)
+        for cy in range(oy - ring + 1, oy + ring):
+            for cx in (ox - ring, ox + ring):
+                members = cells.get((cx, cy))
+                if members is not None:
+                    found.append(members)
+        return found
+
+    def _filter(
+        self,
+        batch: np.ndarray,
+        predicate: Optional[Callable[[pygame.sprite.Sprite], bool]],
+    ) -> np.ndarray:
+        targets = self.targets
+        keep = [
+            index
+            for index in batch.tolist()
+            if targets[index].alive() and (predicate is None or predicate(targets[index]))
+        ]
+        return np.asarray(keep, dtype=np.intp)
+
+    def _distances(self, indices: np.ndarray, px: float, py: float) -> np.ndarray:
+        delta = self.positions[indices] - (px, py)
+        return np.einsum("ij,ij->i", delta, delta)
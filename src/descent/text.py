@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+"""Cached text rendering for the HUD and menus.
+
+``font.render`` rasterizes the whole string on every call. Menus and the HUD
+redraw the same labels every frame, so :class:`TextCache` keeps rendered
+surfaces keyed by (font, text, antialias, color) with LRU eviction.
+:class:`HudText` goes one step further for values that change rarely: it
+remembers the last value it formatted and skips both formatting and the
+cache lookup until the value changes. :class:`TextLayout` memoizes word
+wrapping and pre-renders static multi-line description panels.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+
+TEXT_CACHE_LIMIT = 768
+LAYOUT_CACHE_LIMIT = 256
+# Summing word and space widths drifts from ``font.size`` of the joined line
+# by up to this many pixels per join (glyph rounding and kerning across the
+# space). Sums within that drift of the wrap width are re-measured with
+# ``font.size`` so lines break exactly where measuring every line would.
+WRAP_MEASURE_MARGIN = 2
+
+
+class TextCache:
+    def __init__(self, max_entries: int = TEXT_CACHE_LIMIT) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        antialias: bool,
+        color: Color,
+    ) -> pygame.Surface:
+        """Drop-in for ``font.render(text, antialias, color)``.
+
+        The returned surface is shared and must not be drawn onto.
+        """
+
+        key = (font, text, bool(antialias), tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "capacity": self.max_entries,
+        }
+
+
+TEXT_CACHE = TextCache()
+
+
+class HudText:
+    """A HUD label that only re-renders when its underlying values change."""
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        template: str,
+        color: Color = (220, 220, 220),
+        cache: Optional[TextCache] = None,
+        antialias: bool = True,
+    ) -> None:
+        self.font = font
+        self.template = template
+        self.color = color
+        self.cache = cache if cache is not None else TEXT_CACHE
+        self.antialias = antialias
+        self.renders = 0
+        self._state: Optional[Hashable] = None
+        self._surface: Optional[pygame.Surface] = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._surface is None
+
+    def invalidate(self) -> None:
+        self._state = None
+        self._surface = None
+
+    def render(self, *values: Hashable, color: Optional[Color] = None) -> pygame.Surface:
+        color = self.color if color is None else color
+        state = (values, color)
+        if self._surface is None or state != self._state:
+            text = self.template.format(*values)
+            self._surface = self.cache.render(self.font, text, self.antialias, color)
+            self._state = state
+            self.renders += 1
+        return self._surface
+
+
+class TextLayout:
+    """Memoized word wrapping and pre-rendered multi-line text blocks."""
+
+    def __init__(self, max_entries: int = LAYOUT_CACHE_LIMIT) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lines: "OrderedDict[Hashable, Tuple[str, ...]]" = OrderedDict()
+        self._blocks: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._word_widths: Dict[Tuple[pygame.font.Font, str], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _word_width(self, font: pygame.font.Font, word: str) -> int:
+        key = (font, word)
+        width = self._word_widths.get(key)
+        if width is None:
+            width = font.size(word)[0]
+            self._word_widths[key] = width
+        return width
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+        key = (font, text, int(max_width))
+        lines = self._lines.get(key)
+        if lines is not None:
+            self.hits += 1
+            self._lines.move_to_end(key)
+            return lines
+        self.misses += 1
+        lines = self._break_lines(text, font, max_width)
+        self._lines[key] = lines
+        if len(self._lines) > self.max_entries:
+            self._lines.popitem(last=False)
+        return lines
+
+    def _break_lines(self, text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+        space = self._word_width(font, " ")
+        lines: List[str] = []
+        current_line = ""
+        current_width = 0
+        # Words joined since current_width was last measured exactly.
+        joins = 0
+        for word in text.split():
+            word_width = self._word_width(font, word)
+            test_line = f"{current_line} {word}".strip()
+            estimate = current_width + (space if current_line else 0) + word_width
+            pending = joins + 1 if current_line else 0
+            measured = abs(estimate - max_width) <= WRAP_MEASURE_MARGIN * pending
+            if measured:
+                estimate = font.size(test_line)[0]
+            if estimate <= max_width:
+                current_line = test_line
+                current_width = estimate
+                joins = 0 if measured else pending
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = word
+                current_width = word_width
+                joins = 0
+        if current_line:
+            lines.append(current_line)
+        return tuple(lines)
+
+    def render_block(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        max_width: int,
+        color: Color,
+        line_height: int,
+        align: str = "left",
+        max_lines: Optional[int] = None,
+        cache: Optional[TextCache] = None,
+    ) -> pygame.Surface:
+        """Return one surface holding the wrapped ``text``.
+
+        Lines are ``line_height`` pixels apart and aligned ``"left"`` or
+        ``"center"`` within the widest line.
+        """
+
+        key = (font, text, int(max_width), tuple(color), line_height, align, max_lines)
+        block = self._blocks.get(key)
+        if block is not None:
+            self.hits += 1
+            self._blocks.move_to_end(key)
+            return block
+        self.misses += 1
+        cache = cache if cache is not None else TEXT_CACHE
+        lines = self.wrap(text, font, max_width)
+        if max_lines is not None:
+            lines = lines[:max_lines]
+        surfaces = [cache.render(font, line, True, color) for line in lines]
+        width = max((surface.get_width() for surface in surfaces), default=0)
+        height = line_height * (len(surfaces) - 1) + surfaces[-1].get_height() if surfaces else 0
+        block = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        for index, surface in enumerate(surfaces):
+            x = (width - surface.get_width()) // 2 if align == "center" else 0
+            block.blit(surface, (x, index * line_height))
+        self._blocks[key] = block
+        if len(self._blocks) > self.max_entries:
+            self._blocks.popitem(last=False)
+        return block
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._blocks.clear()
+        self._word_widths.clear()
+
+
+TEXT_LAYOUT = TextLayout()
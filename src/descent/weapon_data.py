@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 import random
 
+from .content import CONTENT
+
 
 @dataclass(frozen=True)
 class WeaponProfile:
@@ -19,40 +22,20 @@ class WeaponProfile:
     keywords: Tuple[str, ...]
 
 
-BASE_TYPES: Dict[str, Dict[str, float]] = {
-    "Pulse": {"damage": 7.0, "fire_rate": 6.0, "speed": 520.0, "spread": 4.0, "magazine": 16, "reload": 1.4},
-    "Burst": {"damage": 5.0, "fire_rate": 9.0, "speed": 480.0, "spread": 6.0, "magazine": 24, "reload": 1.7},
-    "Rail": {"damage": 14.0, "fire_rate": 2.3, "speed": 860.0, "spread": 1.0, "magazine": 6, "reload": 2.2},
-    "Scatter": {"damage": 4.0, "fire_rate": 3.2, "speed": 460.0, "spread": 14.0, "magazine": 12, "reload": 1.9},
-    "Nova": {"damage": 6.5, "fire_rate": 5.2, "speed": 540.0, "spread": 8.0, "magazine": 18, "reload": 1.6},
-    "Arc": {"damage": 8.0, "fire_rate": 4.1, "speed": 600.0, "spread": 5.0, "magazine": 14, "reload": 1.5},
-}
-
-MANUFACTURERS: Dict[str, Dict[str, float]] = {
-    "Helix": {"damage": 0.9, "fire_rate": 1.1, "spread": 0.9, "keywords": ("stabilized",)},
-    "Vyr": {"damage": 1.1, "fire_rate": 1.0, "speed": 1.05, "keywords": ("kinetic",)},
-    "Axiom": {"damage": 1.0, "fire_rate": 1.2, "magazine": 1.2, "keywords": ("auto",)},
-    "Myriad": {"damage": 0.95, "fire_rate": 1.05, "magazine": 1.4, "reload": 0.8, "keywords": ("swarm",)},
-    "Obsidian": {"damage": 1.3, "fire_rate": 0.7, "speed": 1.2, "keywords": ("piercing",)},
-    "Aurora": {"damage": 1.05, "fire_rate": 1.05, "speed": 1.1, "keywords": ("auric",)},
-}
+def _parts(group: str) -> Dict[str, Dict[str, float]]:
+    parts = CONTENT.section("weapon_parts")[group]
+    return {
+        name: {stat: tuple(value) if stat == "keywords" else value for stat, value in part.items()}
+        for name, part in parts.items()
+    }
 
-ELEMENTS: Dict[str, Dict[str, float]] = {
-    "Pyre": {"damage": 1.2, "dot": 1.5, "keywords": ("burn",)},
-    "Frost": {"damage": 1.0, "slow": 0.7, "keywords": ("slow",)},
-    "Volt": {"damage": 0.95, "chain": 2.0, "keywords": ("chain",)},
-    "Toxin": {"damage": 1.1, "dot": 2.1, "keywords": ("poison",)},
-    "Radiant": {"damage": 1.0, "crit": 1.25, "keywords": ("radiant",)},
-    "Umbral": {"damage": 1.15, "lifesteal": 0.05, "keywords": ("void",)},
-}
 
-ELEMENT_COLORS = {
-    "Pyre": (255, 109, 87),
-    "Frost": (132, 206, 235),
-    "Volt": (115, 255, 215),
-    "Toxin": (150, 255, 102),
-    "Radiant": (255, 220, 128),
-    "Umbral": (171, 129, 255),
+# Authored in data/weapons.json; the catalog is expanded by descent.content.
+BASE_TYPES: Dict[str, Dict[str, float]] = _parts("base_types")
+MANUFACTURERS: Dict[str, Dict[str, float]] = _parts("manufacturers")
+ELEMENTS: Dict[str, Dict[str, float]] = _parts("elements")
+ELEMENT_COLORS: Dict[str, Tuple[int, int, int]] = {
+    name: tuple(color) for name, color in CONTENT.section("weapon_parts")["element_colors"].items()
 }
 
 
@@ -60,48 +43,47 @@ TOTAL_WEAPONS = len(BASE_TYPES) * len(MANUFACTURERS) * len(ELEMENTS)
 
 
 def generate_weapon_catalog() -> List[WeaponProfile]:
-    catalog: List[WeaponProfile] = []
-    for base_name, base in BASE_TYPES.items():
-        for maker_name, maker in MANUFACTURERS.items():
-            for element_name, element in ELEMENTS.items():
-                damage = base["damage"] * maker.get("damage", 1.0) * element["damage"]
-                fire_rate = base["fire_rate"] * maker.get("fire_rate", 1.0)
-                projectile_speed = base["speed"] * maker.get("speed", 1.0)
-                spread = base["spread"] * maker.get("spread", 1.0)
-                magazine = max(4, int(base["magazine"] * maker.get("magazine", 1.0)))
-                reload_time = base["reload"] * maker.get("reload", 1.0)
-                keywords = (
-                    base_name.lower(),
-                    maker_name.lower(),
-                    element_name.lower(),
-                ) + maker.get("keywords", ()) + element.get("keywords", ())
-
-                name = f"{element_name} {maker_name} {base_name}"
-                color = ELEMENT_COLORS[element_name]
-                catalog.append(
-                    WeaponProfile(
-                        name=name,
-                        base_damage=round(damage, 2),
-                        fire_rate=round(fire_rate, 2),
-                        projectile_speed=round(projectile_speed, 2),
-                        spread=round(spread, 2),
-                        magazine=magazine,
-                        reload_time=round(reload_time, 2),
-                        color=color,
-                        keywords=keywords,
-                    )
-                )
-    return catalog
-
-
-WEAPON_CATALOG: List[WeaponProfile] = generate_weapon_catalog()
-
-
-def random_weapon(exclude: Iterable[str] | None = None) -> WeaponProfile:
+    return [WeaponProfile(**record) for record in CONTENT.records("weapons")]
+
+
+@lru_cache(maxsize=1)
+def weapon_catalog() -> List[WeaponProfile]:
+    """The shipped catalog, built from the compiled content on first use."""
+
+    return generate_weapon_catalog()
+
+
+def __getattr__(name: str) -> object:
+    # ``WEAPON_CATALOG`` stays importable for tools that want the list eagerly.
+    if name == "WEAPON_CATALOG":
+        return weapon_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def random_weapon(exclude: Iterable[str] | None = None, weights: Sequence[float] | None = None) -> WeaponProfile:
+    """Roll a catalog weapon, optionally weighted per ``WEAPON_CATALOG`` index."""
+
+    catalog = weapon_catalog()
     exclude = set(exclude or ())
-    choices = [weapon for weapon in WEAPON_CATALOG if weapon.name not in exclude]
+    if weights is not None:
+        pool = [
+            (weapon, weight)
+            for weapon, weight in zip(catalog, weights)
+            if weapon.name not in exclude and weight > 0
+        ]
+        if pool:
+            return random.choices([weapon for weapon, _ in pool], [weight for _, weight in pool])[0]
+    choices = [weapon for weapon in catalog if weapon.name not in exclude]
     if not choices:
-        return random.choice(WEAPON_CATALOG)
+        return random.choice(catalog)
     return random.choice(choices)
 
 
+def weapons_with_keyword(keyword: str) -> List[WeaponProfile]:
+    catalog = weapon_catalog()
+    return [catalog[position] for position in CONTENT.find("keyword", keyword, "weapons")]
+
+
+def weapons_of_element(element: str) -> List[WeaponProfile]:
+    catalog = weapon_catalog()
+    return [catalog[position] for position in CONTENT.find("element", element, "weapons")]